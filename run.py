@@ -11,6 +11,13 @@ import asyncio
 from pathlib import Path
 import platform
 
+# Use uvloop's faster event loop when available (not supported on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure UTF-8 output for Windows
 if os.name == 'nt':  # Windows
     import io
@@ -85,13 +92,16 @@ def main():
     mode_str = "GUI mode" if gui_enabled else "headless mode"
     
     app_logger.info(f"Starting Memoire application in {mode_str}")
-    safe_print(f"🚀 Starting Memoire in {mode_str}")
+    # Emit the startup banner with a single stderr write
+    banner = [f"🚀 Starting Memoire in {mode_str}"]
     
     if is_wsl():
-        safe_print("ℹ️ WSL environment detected")
+        banner.append("ℹ️ WSL environment detected")
     
     if not gui_enabled:
-        safe_print("ℹ️ Set ENABLE_GUI=true to force GUI mode")
+        banner.append("ℹ️ Set ENABLE_GUI=true to force GUI mode")
+    
+    safe_print("\n".join(banner))
     
     # Import using the ORIGINAL style that worked
     from src.app import MemoireApp
@@ -110,6 +120,9 @@ def main():
     try:
         # Run the unified app
         app_logger.info("Starting unified application")
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            app_logger.info("Using uvloop event loop")
         success = asyncio.run(app.run())
         if not success:
             app_logger.error("Application failed to start")
@@ -119,10 +132,8 @@ def main():
         app_logger.info("Received keyboard interrupt")
         safe_print("\n🛑 Received interrupt signal")
     except Exception as e:
-        app_logger.info(f"Error in main process: {e}", exc_info=True)
-        safe_print(f"❌ Error in main process: {e}")
-        import traceback
-        safe_print(f"📊 Main traceback:\n{traceback.format_exc()}")
+        # Logged once with its traceback; the console handler also echoes errors to stderr
+        app_logger.exception(f"Error in main process: {e}")
         sys.exit(1)
     finally:
         app_logger.info("Application stopped")
@@ -7,6 +7,7 @@ import os
 import subprocess
 import sys
 import asyncio
+import gc
 import threading
 import time
 from pathlib import Path
@@ -94,11 +95,12 @@ class MemoireApp:
             from src.core.embedding import EmbeddingService
             from src.core.memory import MemoryService
             
-            self.logger.info("Creating StorageManager...")
-            self.storage = StorageManager(use_memory=False)
-            
-            self.logger.info("Creating EmbeddingService...")
-            self.embedding = EmbeddingService()
+            # Storage (disk open) and embedding (API client setup) are independent, so build them concurrently
+            self.logger.info("Creating StorageManager and EmbeddingService...")
+            self.storage, self.embedding = await asyncio.gather(
+                asyncio.to_thread(StorageManager, use_memory=False),
+                asyncio.to_thread(EmbeddingService)
+            )
             
             self.logger.info("Creating MemoryService...")
             self.memory = MemoryService(self.storage, self.embedding)
@@ -142,11 +144,9 @@ class MemoireApp:
         """Initialize simplified tray system."""
         if not self.enable_gui:
             self.logger.info("GUI disabled - skipping tray initialization")
-            self.logger.info("GUI disabled - running in headless mode")
             return True  # Return True so app continues
             
         if not TRAY_AVAILABLE:
-            self.logger.warning("Tray dependencies not available")
             self.logger.warning("Tray dependencies not available")
             return False
             
@@ -154,12 +154,10 @@ class MemoireApp:
             self.logger.info("Configuring simplified tray system...")
             # Tray will be created later with direct GUI instance reference
             self.logger.info("Tray system configured successfully")
-            self.logger.info("Tray system configured")
             return True
             
         except Exception as e:
             self.logger.error(f"Error initializing tray: {e}", exc_info=True)
-            self.logger.error(f"Tray error: {e}")
             return False
     
 
@@ -189,7 +187,6 @@ class MemoireApp:
                 
             except Exception as e:
                 self.logger.error(f"Tray thread error: {e}", exc_info=True)
-                self.logger.error(f"Tray thread error: {e}", exc_info=True)
                 
         
         self.logger.info("Starting tray thread...")
@@ -207,7 +204,6 @@ class MemoireApp:
             if self.gui_created and self.gui_instance:
                 # GUI already exists, just show it
                 self.logger.info("Bringing existing GUI to front")
-                self.logger.info("Bringing existing GUI to front")
                 try:
                     self.gui_instance.show_window()
                     self.gui_visible = True
@@ -221,7 +217,6 @@ class MemoireApp:
             if not self.gui_created:
                 # Create new GUI instance
                 self.logger.info("Creating new GUI instance")
-                self.logger.info("Creating new GUI instance")
                 
                 def run_gui():
                     try:
@@ -251,7 +246,6 @@ class MemoireApp:
                         self.gui_instance = None
                         
                     except Exception as e:
-                        self.logger.error(f"GUI error: {e}", exc_info=True)
                         self.logger.error(f"GUI error: {e}", exc_info=True)
                         self.gui_created = False
                         self.gui_instance = None
@@ -260,7 +254,6 @@ class MemoireApp:
                 self.gui_thread.start()
                 
                 self.logger.info("GUI thread started")
-                self.logger.info("GUI thread started")
     
     def hide_gui(self):
         """Hide GUI window."""
@@ -312,7 +305,6 @@ class MemoireApp:
             
         if not self.initialize_tray():
             self.logger.warning("Tray initialization failed, continuing without tray")
-            self.logger.warning("Continuing without system tray")
         
         # Start tray only if GUI is enabled (GUI opens on demand)
         if self.enable_gui:
@@ -322,6 +314,10 @@ class MemoireApp:
         else:
             self.logger.info("Running in headless mode - no GUI/tray")
         
+        # Move the long-lived objects created during startup out of the collected generations,
+        # so later collections only scan per-request garbage
+        gc.freeze()
+        
         # Run MCP server (this blocks until shutdown)
         self.logger.info("All components started, running MCP server...")
         self.is_running = True
@@ -5,6 +5,7 @@ Handles JSON config loading, hot reloading, and environment variable overrides.
 
 import json
 import os
+import weakref
 from pathlib import Path
 from typing import Dict, Any, Optional
 from threading import Lock
@@ -122,14 +123,32 @@ class ConfigManager:
         """Add observer for configuration changes."""
         self._observers.append(callback)
     
+    def add_observer_weak(self, callback):
+        """Add a bound-method observer without keeping its owner alive.
+        
+        The observer is dropped automatically once the owning object is garbage collected.
+        """
+        self._observers.append(weakref.WeakMethod(callback))
+    
     def remove_observer(self, callback):
         """Remove configuration change observer."""
-        if callback in self._observers:
-            self._observers.remove(callback)
+        for observer in list(self._observers):
+            if isinstance(observer, weakref.WeakMethod):
+                if observer() == callback:
+                    self._observers.remove(observer)
+            elif observer == callback:
+                self._observers.remove(observer)
     
     def _notify_observers(self):
         """Notify all observers of configuration changes."""
-        for callback in self._observers:
+        for observer in list(self._observers):
+            callback = observer
+            if isinstance(observer, weakref.WeakMethod):
+                callback = observer()
+                if callback is None:
+                    # Owner was garbage collected, drop the dead reference
+                    self._observers.remove(observer)
+                    continue
             try:
                 callback(self._config)
             except Exception as e:
@@ -167,7 +186,9 @@ class ConfigManager:
                 "dimension": 3072,
                 "cache_ttl_hours": 24,
                 "batch_size": 10,
-                "delay_seconds": 0.1
+                "delay_seconds": 0.1,
+                "max_batch": 32,
+                "max_wait_ms": 5
             },
             "processing": {
                 "model": "gemini-2.5-flash",
@@ -179,6 +200,11 @@ class ConfigManager:
                 "similarity_threshold": 0.6,
                 "max_results": 50
             },
+            "cache": {
+                "recall_threshold": 0.92,
+                "recall_ttl_seconds": 900,
+                "recall_max_entries": 256
+            },
             "chunking": {
                 "min_chunk_words": 20,
                 "max_chunk_words": 150,
@@ -200,7 +226,12 @@ class ConfigManager:
             "intelligence": {
                 "enable_curation": True,
                 "curation_similarity_threshold": 0.54,
-                "curation_search_threshold": 0.4
+                "curation_search_threshold": 0.4,
+                "synthesis_cache_threshold": 0.95,
+                "synthesis_cache_size": 128,
+                "telemetry_enabled": False,
+                "recall_timeout_seconds": 30,
+                "max_concurrent_pipelines": 8
             },
             "logging": {
                 "level": "INFO",
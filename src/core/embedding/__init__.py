@@ -8,9 +8,11 @@ Organized into logical units for maintainability.
 from .service import EmbeddingService
 from .cache import EmbeddingCache  
 from .providers import GeminiProvider
+from .batcher import EmbeddingBatcher
 
 __all__ = [
     "EmbeddingService",
     "EmbeddingCache", 
-    "GeminiProvider"
+    "GeminiProvider",
+    "EmbeddingBatcher"
 ]
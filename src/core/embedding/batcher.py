@@ -0,0 +1,116 @@
+"""
+Micro-batching of embedding requests.
+
+Concurrent callers submit single texts; texts arriving within a short window
+are embedded together with one provider call instead of one call per text.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from src.logging_config import get_logger
+from .service import EmbeddingService
+
+logger = get_logger('memoire.mcp.embedding')
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent single-text embedding requests into batched calls."""
+
+    def __init__(self, embedding_service: EmbeddingService, max_batch: int = 32, max_wait_ms: float = 5):
+        """Initialize the batcher.
+
+        Args:
+            embedding_service: Service used to embed each collected batch
+            max_batch: Maximum number of texts per batch
+            max_wait_ms: Maximum time to wait for more texts after the first one arrives
+        """
+        self.embedding = embedding_service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        logger.info(f"EmbeddingBatcher initialized (max batch: {max_batch}, max wait: {max_wait_ms}ms)")
+
+    async def submit(self, text: str) -> List[float]:
+        """Embed a single text, batched with other texts submitted at the same time."""
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        # Cached texts do not need to wait for a batch
+        cached_embedding = self.embedding.cache.get(text, self.embedding.model)
+        if cached_embedding is not None:
+            return cached_embedding
+
+        # The queue and worker are bound to the running loop, so create them lazily
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one request, then gather more until the batch is full or the window closes."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: embed each collected batch and resolve the waiting futures."""
+        while True:
+            batch = await self._collect_batch()
+
+            # Identical texts in one batch are embedded once
+            waiters: Dict[str, List[asyncio.Future]] = {}
+            for text, future in batch:
+                waiters.setdefault(text, []).append(future)
+            texts = list(waiters)
+
+            try:
+                embeddings = await self.embedding.embed_batch(texts)
+                logger.debug(f"Embedded batch of {len(texts)} texts for {len(batch)} requests")
+            except Exception as e:
+                self._fail(waiters, e)
+                continue
+
+            # A short response would leave some callers waiting forever
+            if len(embeddings) != len(texts):
+                self._fail(waiters, RuntimeError(
+                    f"Embedding provider returned {len(embeddings)} vectors for {len(texts)} texts"
+                ))
+                continue
+
+            for text, embedding in zip(texts, embeddings):
+                for future in waiters[text]:
+                    if not future.done():
+                        future.set_result(embedding)
+
+    @staticmethod
+    def _fail(waiters: Dict[str, List[asyncio.Future]], error: Exception) -> None:
+        """Resolve every pending future of a batch with the error."""
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def close(self) -> None:
+        """Stop the worker task."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -30,10 +30,14 @@ class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
     
     @abstractmethod
-    async def generate_embedding(self, text: str) -> List[float]:
+    async def generate_embedding(self, text: str, task_type: str = None) -> List[float]:
         """Generate embedding for a single text."""
         pass
     
+    async def generate_embeddings(self, texts: List[str], task_type: str = None) -> List[List[float]]:
+        """Generate embeddings for several texts. Providers with a batch API should override this."""
+        return [await self.generate_embedding(text, task_type=task_type) for text in texts]
+    
     @abstractmethod
     def get_dimension(self) -> int:
         """Get the dimension of embeddings produced by this provider."""
@@ -120,7 +124,7 @@ class GeminiProvider(EmbeddingProvider):
             # Call Gemini API
             config = types.EmbedContentConfig(task_type=task_type) if task_type else None
             logger.debug(f"Calling Gemini API with model={self.model}, task_type={task_type}")
-            response = self.client.models.embed_content(
+            response = await self.client.aio.models.embed_content(
                 model=self.model,
                 contents=text,
                 config=config
@@ -134,6 +138,37 @@ class GeminiProvider(EmbeddingProvider):
         except Exception as e:
             logger.error(f"Gemini API call failed: {e}", exc_info=True)
             raise RuntimeError(f"Failed to generate embedding: {e}")
+
+    async def generate_embeddings(self, texts: List[str], task_type: str = None) -> List[List[float]]:
+        """Generate embeddings for several texts with a single Gemini API call.
+        
+        Args:
+            texts: Texts to embed
+            task_type: The task type for the embeddings (e.g., 'RETRIEVAL_QUERY')
+            
+        Returns:
+            Embedding vectors, in the same order as texts
+            
+        Raises:
+            RuntimeError: If API call fails
+        """
+        if not texts:
+            return []
+        
+        try:
+            config = types.EmbedContentConfig(task_type=task_type) if task_type else None
+            logger.debug(f"Calling Gemini API with model={self.model}, batch size={len(texts)}")
+            # Async client, so other requests can reach the embedding batcher while this call is in flight
+            response = await self.client.aio.models.embed_content(
+                model=self.model,
+                contents=texts,
+                config=config
+            )
+            return [embedding.values for embedding in response.embeddings]
+            
+        except Exception as e:
+            logger.error(f"Gemini batch API call failed: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to generate embeddings: {e}")
     
     def get_dimension(self) -> int:
         """Get embedding dimension."""
@@ -156,7 +191,7 @@ class AnthropicProvider(EmbeddingProvider):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         logger.warning("AnthropicProvider is a placeholder - embeddings API not yet available")
 
-    async def generate_embedding(self, text: str) -> List[float]:
+    async def generate_embedding(self, text: str, task_type: str = None) -> List[float]:
         """Generate embedding using Anthropic API (not yet available)."""
         logger.error("generate_embedding called on placeholder AnthropicProvider")
         raise NotImplementedError("Anthropic embeddings API not yet available")
@@ -83,6 +83,28 @@ class EmbeddingService:
 
         return embedding
     
+    async def embed_batch(self, texts: List[str], task_type: str = None) -> List[List[float]]:
+        """Generate embeddings for several texts with one provider call for the cache misses.
+        
+        Args:
+            texts: Non-empty texts to embed
+            task_type: The task type for the embeddings
+            
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        embeddings: List[Optional[List[float]]] = [self.cache.get(text, self.model) for text in texts]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            logger.debug(f"Batch cache misses: {len(missing)}/{len(texts)}")
+            generated = await self.provider.generate_embeddings([texts[i] for i in missing], task_type=task_type)
+            if len(generated) != len(missing):
+                raise RuntimeError(f"Embedding provider returned {len(generated)} vectors for {len(missing)} texts")
+            for i, embedding in zip(missing, generated):
+                self.cache.set(texts[i], self.model, embedding)
+                embeddings[i] = embedding
+        return embeddings
+    
     async def batch_embeddings(self, texts: List[str], 
                              batch_size: int = None,
                              delay_seconds: float = None) -> List[List[float]]:
@@ -17,7 +17,9 @@ logger = get_logger('memoire.mcp.memory')
 async def search_memory(storage: StorageManager, embedding_service: EmbeddingService,
                        query: str, options: SearchOptions = None,
                        project_ids: Optional[Union[str, List[str]]] = None,
-                       default_project_id: str = None) -> Dict[str, Dict[str, List[SearchResult]]]:
+                       default_project_id: str = None,
+                       query_embedding: Optional[List[float]] = None,
+                       options_by_project: Optional[Dict[str, SearchOptions]] = None) -> Dict[str, Dict[str, List[SearchResult]]]:
     """
     Search memory using semantic similarity and filters, with mandatory grouping.
     
@@ -28,6 +30,8 @@ async def search_memory(storage: StorageManager, embedding_service: EmbeddingSer
         options: Search configuration options
         project_ids: Project(s) to search in (single ID, list of IDs, or None for global search).
         default_project_id: Default project ID if none specified in options.
+        query_embedding: Precomputed embedding of the query, generated if not given.
+        options_by_project: Cache of per-project copies of options, reused across calls with the same options.
         
     Returns:
         A dictionary grouped by project_id, then by context_id, containing lists of SearchResult objects.
@@ -57,8 +61,9 @@ async def search_memory(storage: StorageManager, embedding_service: EmbeddingSer
             logger.error("Search failed: No project_ids specified and no default_project_id available.")
             raise ValueError("No project specified and no default project available for search.")
     
-    # Generate query embedding
-    query_embedding = await embedding_service.generate_embedding(query)
+    # Generate query embedding unless the caller already has it
+    if query_embedding is None:
+        query_embedding = await embedding_service.generate_embedding(query)
 
     # Perform search and group results
     grouped_results: Dict[str, Dict[str, List[SearchResult]]] = {}
@@ -66,7 +71,11 @@ async def search_memory(storage: StorageManager, embedding_service: EmbeddingSer
     for p_id in target_project_ids:
         logger.debug(f"Searching in project_id: {p_id}")
         # Ensure options are specific to the current project for the search call
-        current_options = options.copy(update={'project_id': p_id})
+        current_options = options_by_project.get(p_id) if options_by_project is not None else None
+        if current_options is None:
+            current_options = options.copy(update={'project_id': p_id})
+            if options_by_project is not None:
+                options_by_project[p_id] = current_options
         
         # Perform search for the current project
         project_search_results = storage.search_fragments(query_embedding, current_options)
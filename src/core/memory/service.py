@@ -43,6 +43,11 @@ class MemoryService:
         
         # Get config instance
         self.config = config
+
+        # Default search options per project, rebuilt when the search config changes
+        self._search_options_by_project: Dict[str, SearchOptions] = {}
+        self._search_options_key = None
+        self._default_search_options: Optional[SearchOptions] = None
         
         logger.info("MemoryService initialized (modular architecture)")
 
@@ -167,16 +172,23 @@ class MemoryService:
     
     async def search_memory(self, query: str, 
                           project_ids: Optional[Union[str, List[str]]] = None,
-                          options: SearchOptions = None) -> List[SearchResult]:
+                          options: SearchOptions = None,
+                          query_embedding: Optional[List[float]] = None) -> List[SearchResult]:
         """Search memory using semantic similarity and filters."""
+        options_by_project = None
         if options is None:
             # Get default threshold from config
             threshold = config.get("search.similarity_threshold", 0.6)
             max_results = config.get("search.max_results", 50)
-            options = SearchOptions(
-                similarity_threshold=threshold,
-                max_results=max_results
-            )
+            if self._search_options_key != (threshold, max_results):
+                self._search_options_key = (threshold, max_results)
+                self._default_search_options = SearchOptions(
+                    similarity_threshold=threshold,
+                    max_results=max_results
+                )
+                self._search_options_by_project.clear()
+            options = self._default_search_options
+            options_by_project = self._search_options_by_project
         
         # Handle project_ids: convert single string to list, or use None for global search
         if isinstance(project_ids, str):
@@ -187,7 +199,8 @@ class MemoryService:
             project_ids_list = project_ids # Already a list
 
         return await search.search_memory(
-            self.storage, self.embedding, query, options, project_ids, self._default_project_id
+            self.storage, self.embedding, query, options, project_ids, self._default_project_id,
+            query_embedding, options_by_project
         )
 
     async def search_memory_by_vector(self, query_vector: List[float], options: SearchOptions) -> List[SearchResult]:
@@ -1,6 +1,7 @@
 """Database initialization and common operations."""
 
 import sqlite3
+import weakref
 from pathlib import Path
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.models import Distance, VectorParams
@@ -10,6 +11,10 @@ from ...config import config
 
 logger = get_logger('memoire.mcp.storage')
 
+# Collection names known to exist per Qdrant client, so hot paths skip the get_collection round trip.
+# Weak keys drop a client's entry when it is garbage-collected.
+_known_collections = weakref.WeakKeyDictionary()
+
 def init_sqlite(db_path):
     """Create SQLite tables if they don't exist."""
     try:
@@ -112,6 +117,9 @@ def init_sqlite(db_path):
 def get_or_create_collection(qdrant_client, project_id):
     """Get or create Qdrant collection for a project."""
     collection_name = f"project_{project_id.replace('-', '_')}"
+    known = _known_collections.setdefault(qdrant_client, set())
+    if collection_name in known:
+        return collection_name
 
     # Get Qdrant config values
     hnsw_m = config.get("storage.qdrant.hnsw_m", 16)
@@ -143,4 +151,11 @@ def get_or_create_collection(qdrant_client, project_id):
         )
         logger.info(f"Created new collection: {collection_name}")
     
-    return collection_name
\ No newline at end of file
+    known.add(collection_name)
+    return collection_name
+
+def forget_collection(qdrant_client, collection_name):
+    """Drop a collection from the known-collections memo after it is deleted."""
+    known = _known_collections.get(qdrant_client)
+    if known is not None:
+        known.discard(collection_name)
\ No newline at end of file
@@ -44,6 +44,10 @@ class StorageManager:
         # Subscribe to config changes for hot reload
         config.add_observer(self._on_config_change)
         
+        # Bumped after every project create/update/delete so callers can cache project metadata;
+        # a lookup racing the write is cached under the old version and refreshed on the next call
+        self.projects_version = 0
+        
         # Always resolve data_dir relative to project root if not absolute
         if not Path(data_dir).is_absolute():
             project_root = Path(__file__).parent.parent.parent.parent  # From src/core/storage/ to project root
@@ -91,7 +95,10 @@ class StorageManager:
     
     def create_project(self, project: Project) -> str:
         """Create a new project."""
-        return create_project(self.db_path, self.qdrant_client, project)
+        try:
+            return create_project(self.db_path, self.qdrant_client, project)
+        finally:
+            self.projects_version += 1
     
     def get_project(self, project_id: str) -> Optional[Project]:
         """Get project by ID."""
@@ -103,11 +110,17 @@ class StorageManager:
     
     def delete_project(self, project_id: str):
         """Delete a project and all its data."""
-        return delete_project(self.db_path, self.qdrant_client, project_id)
+        try:
+            return delete_project(self.db_path, self.qdrant_client, project_id)
+        finally:
+            self.projects_version += 1
     
     def update_project(self, project: Project) -> bool:
         """Update an existing project."""
-        return update_project(self.db_path, project)
+        try:
+            return update_project(self.db_path, project)
+        finally:
+            self.projects_version += 1
     
     # ==================== FRAGMENT OPERATIONS ====================
     
@@ -90,6 +90,8 @@ def count_projects(db_path) -> int:
 
 def delete_project(db_path, qdrant_client, project_id: str):
     """Delete a project and all its data."""
+    from .db import forget_collection
+    
     # Delete from SQLite (cascade will handle related data)
     try:
         conn = sqlite3.connect(db_path)
@@ -104,6 +106,7 @@ def delete_project(db_path, qdrant_client, project_id: str):
     try:
         collection_name = f"project_{project_id.replace('-', '_')}"
         qdrant_client.delete_collection(collection_name)
+        forget_collection(qdrant_client, collection_name)
     except Exception as e:
         logger.warning(f"Failed to delete Qdrant collection {collection_name}: {e}")
     
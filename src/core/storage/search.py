@@ -6,13 +6,12 @@ from qdrant_client import models
 from src.logging_config import get_logger
 from ...models import SearchOptions
 from ...config import config
+from .db import get_or_create_collection
 
 logger = get_logger('memoire.mcp.storage')
 
 def semantic_search(qdrant_client, query_embedding: List[float], options: SearchOptions) -> List[Tuple[str, float]]:
     """Perform semantic search using Qdrant."""
-    from .db import get_or_create_collection
-    
     if not options.project_id:
         logger.error("semantic_search failed: Project ID is required.")
         raise ValueError("Project ID required for search")
@@ -13,6 +13,9 @@ from .chunking import SemanticChunker, ContextualChunker
 from .contextualization import EmergentContextualizer
 from .synthesis import MemorySynthesizer
 from .ingestion_curator import IngestionCurator # New import
+from .synthesis_cache import SynthesisCache
+from .vector_store import ScopedVectorStore
+from .telemetry import PipelineEvent, stage_timer
 
 __all__ = [
     "IntelligentMiddleware",
@@ -20,5 +23,9 @@ __all__ = [
     "ContextualChunker",
     "EmergentContextualizer",
     "MemorySynthesizer",
-    "IngestionCurator" # Updated
+    "IngestionCurator", # Updated
+    "SynthesisCache",
+    "ScopedVectorStore",
+    "PipelineEvent",
+    "stage_timer"
 ]
@@ -10,9 +10,30 @@ from google.genai.types import GenerateContentConfig
 from ...models import SearchResult, SearchOptions, MemoryContext
 from ...core.memory import MemoryService
 from ...config import config
+from .telemetry import stage_timer
 
 logger = get_logger('memoire.mcp.intelligence')
 
+# Static part of the curation prompt. It is sent as the first content part, ahead of
+# the per-call data, so identical prefixes can be reused by Gemini's implicit caching.
+_CURATION_PROMPT = """
+        Eres un asistente experto en organización de memoria semántica. Tu tarea es analizar nuevo contenido y decidir cómo integrarlo de la forma más coherente y fiel posible en una memoria existente.
+        Los datos a procesar (NUEVO CONTENIDO, CONTEXTOS YA DISPONIBLES y FRAGMENTOS EXISTENTES SIMILARES) se proporcionan al final.
+        ---
+        CRITERIOS DE FRAGMENTACIÓN:
+        1.  **Integridad Semántica**: Cada fragmento debe ser una idea completa que tenga sentido por sí misma.
+        2.  **Fidelidad al Original**: NO RESUMAS NI ALTERES el significado original. El contenido de los fragmentos, al unirse, debe ser idéntico al input. Las ediciones son solo para segmentar, no para parafrasear o modificar.
+        3.  **División por Contexto**: Usa los cambios de tema, sujeto o pasos lógicos como puntos de división naturales.
+        4.  **Autocontención**: Un fragmento no debe depender del anterior o siguiente para ser comprendido.
+        5.  **Sin Límites Artificiales**: La longitud de un fragmento la determina su coherencia semántica, no un número de palabras.
+        ---
+        INSTRUCCIONES DE EJECUCIÓN:
+        1.  Aplica los `CRITERIOS DE FRAGMENTACIÓN` al `NUEVO CONTENIDO` para decidir los nuevos `fragments_to_create`.
+        2.  Asigna a cada nuevo fragmento un `context_name` de los `CONTEXTOS YA DISPONIBLES` o define uno nuevo en `contexts_to_create` si es necesario. Un buen contexto es reutilizable y describe un tema claro.
+        3.  Si el `NUEVO CONTENIDO` actualiza o reemplaza `FRAGMENTOS EXISTENTES`, añade sus IDs a `ids_to_delete` y crea los nuevos fragmentos corregidos. El objetivo es que la memoria evolucione sin redundancia.
+        4.  Tu respuesta DEBE seguir el esquema JSON proporcionado. No incluyas explicaciones fuera del JSON.
+        """
+
 
 class IngestionCurator:
     """Handles intelligent curation during the ingestion process."""
@@ -42,7 +63,9 @@ class IngestionCurator:
                 max_results=config.get("search.max_results", 50),
                 similarity_threshold=config.get("intelligence.curation_search_threshold", 0.4)
             )
-            relevant_fragments = await self.memory_service.search_memory_by_vector(embedding, search_options)
+            with stage_timer("search", n_in=1, bytes_in=len(content)) as event:
+                relevant_fragments = await self.memory_service.search_memory_by_vector(embedding, search_options)
+                event["n_out"] = len(relevant_fragments)
         except Exception as e:
             logger.error(f"Failed to search for relevant fragments during curation: {e}", exc_info=True)
             relevant_fragments = []
@@ -112,12 +135,15 @@ class IngestionCurator:
         )
         
         try:
-            response = self.gemini_client.models.generate_content(
-                model=self.light_model,
-                contents=prompt,
-                config=config
-            )
-            decision = json.loads(response.text)
+            with stage_timer("curate", n_in=len(existing_fragments), bytes_in=sum(len(part) for part in prompt)) as event:
+                response = self.gemini_client.models.generate_content(
+                    model=self.light_model,
+                    contents=prompt,
+                    config=config
+                )
+                decision = json.loads(response.text)
+                event["n_out"] = len(decision.get("fragments_to_create", []))
+                event["bytes_out"] = len(response.text)
             # Ensure all required keys are present, even if empty
             decision.setdefault('contexts_to_create', [])
             decision.setdefault('fragments_to_create', [])
@@ -127,14 +153,15 @@ class IngestionCurator:
             logger.error(f"Failed to get structured curation decision from LLM: {e}", exc_info=True)
             raise e
 
-    def _build_curation_prompt_with_context(self, new_content: str, existing_fragments: List[SearchResult], existing_contexts: List[MemoryContext]) -> str:
-        """Builds the prompt for the LLM curation task, including existing contexts."""
+    def _build_curation_prompt_with_context(self, new_content: str, existing_fragments: List[SearchResult], existing_contexts: List[MemoryContext]) -> List[str]:
+        """Builds the prompt parts for the LLM curation task, including existing contexts."""
         # This is a pure function, extensive logging is less critical here.
         # A single debug log at the start can be useful.
-        fragments_text = ""
-        for i, res in enumerate(existing_fragments):
-            fragments_text += f"\n--- FRAGMENTO EXISTENTE {i+1} (ID: {res.fragment.id}) ---"
-            fragments_text += f"Contenido: {res.fragment.content}\n"
+        fragments_text = "".join(
+            f"\n--- FRAGMENTO EXISTENTE {i+1} (ID: {res.fragment.id}) ---"
+            f"Contenido: {res.fragment.content}\n"
+            for i, res in enumerate(existing_fragments)
+        )
 
         contexts_text = "No hay contextos existentes."
         if existing_contexts:
@@ -142,9 +169,7 @@ class IngestionCurator:
                 f"- {ctx.name}: {ctx.description}" for ctx in existing_contexts
             ])
 
-        return f"""
-        Eres un asistente experto en organización de memoria semántica. Tu tarea es analizar nuevo contenido y decidir cómo integrarlo de la forma más coherente y fiel posible en una memoria existente.
-
+        return [_CURATION_PROMPT, f"""
         NUEVO CONTENIDO A PROCESAR:
         {new_content}
         ---
@@ -152,21 +177,8 @@ class IngestionCurator:
         {contexts_text}
         ---
         FRAGMENTOS EXISTENTES SIMILARES (para evitar duplicados y guiar la edición):
-        {fragments_text if fragments_text else "No se encontraron fragmentos existentes relevantes."} 
-        ---
-        CRITERIOS DE FRAGMENTACIÓN:
-        1.  **Integridad Semántica**: Cada fragmento debe ser una idea completa que tenga sentido por sí misma.
-        2.  **Fidelidad al Original**: NO RESUMAS NI ALTERES el significado original. El contenido de los fragmentos, al unirse, debe ser idéntico al input. Las ediciones son solo para segmentar, no para parafrasear o modificar.
-        3.  **División por Contexto**: Usa los cambios de tema, sujeto o pasos lógicos como puntos de división naturales.
-        4.  **Autocontención**: Un fragmento no debe depender del anterior o siguiente para ser comprendido.
-        5.  **Sin Límites Artificiales**: La longitud de un fragmento la determina su coherencia semántica, no un número de palabras.
-        ---
-        INSTRUCCIONES DE EJECUCIÓN:
-        1.  Aplica los `CRITERIOS DE FRAGMENTACIÓN` al `NUEVO CONTENIDO` para decidir los nuevos `fragments_to_create`.
-        2.  Asigna a cada nuevo fragmento un `context_name` de los `CONTEXTOS YA DISPONIBLES` o define uno nuevo en `contexts_to_create` si es necesario. Un buen contexto es reutilizable y describe un tema claro.
-        3.  Si el `NUEVO CONTENIDO` actualiza o reemplaza `FRAGMENTOS EXISTENTES`, añade sus IDs a `ids_to_delete` y crea los nuevos fragmentos corregidos. El objetivo es que la memoria evolucione sin redundancia.
-        4.  Tu respuesta DEBE seguir el esquema JSON proporcionado. No incluyas explicaciones fuera del JSON.
-        """
+        {fragments_text if fragments_text else "No se encontraron fragmentos existentes relevantes."}
+        """]
 
     async def _apply_curation_decision(self, decision: Dict[str, Any], project_id: str, existing_contexts: List[MemoryContext]) -> Dict[str, Any]:
         """Applies the structured curation decision from the LLM to the memory."""
@@ -180,7 +192,9 @@ class IngestionCurator:
         # 1. Delete old fragments
         if ids_to_delete:
             logger.info(f"Deleting {len(ids_to_delete)} fragments due to curation: {ids_to_delete}")
-            await self.memory_service.delete_fragments(ids_to_delete, project_id)
+            with stage_timer("delete", n_in=len(ids_to_delete)) as event:
+                await self.memory_service.delete_fragments(ids_to_delete, project_id)
+                event["n_out"] = len(ids_to_delete)
 
         # 2. Create new contexts
         context_map = {ctx.name: ctx.id for ctx in existing_contexts}
@@ -14,6 +14,8 @@ from .chunking import SemanticChunker, ContextualChunker
 from .contextualization import EmergentContextualizer
 from .synthesis import MemorySynthesizer
 from .ingestion_curator import IngestionCurator
+from .synthesis_cache import SynthesisCache
+from .telemetry import stage_timer
 
 logger = get_logger('memoire.mcp.intelligence')
 
@@ -44,19 +46,29 @@ class IntelligentMiddleware:
         
         self.ingestion_curator = IngestionCurator(self.gemini_client, memory_service)
         self.synthesizer = MemorySynthesizer(self.gemini_client, memory_service=memory_service)
+        self.synthesis_cache = SynthesisCache(
+            similarity_threshold=config.get("intelligence.synthesis_cache_threshold", 0.95),
+            max_entries=config.get("intelligence.synthesis_cache_size", 128)
+        )
         logger.info("Intelligence modules initialized")
 
     async def curate_and_chunk(self, content: str, project_id: str) -> Dict[str, Any]:
         """Public method to expose the ingestion curator's functionality."""
-        result = await self.ingestion_curator.curate_and_chunk(content, project_id)
-        return result
+        try:
+            return await self.ingestion_curator.curate_and_chunk(content, project_id)
+        finally:
+            self.synthesis_cache.invalidate_project(project_id)
     
-    async def process_recall(self, query: str, project_ids: Optional[Union[str, List[str]]] = None, focus: Optional[str] = None, raw_fragments: bool = False) -> Dict[str, Any]:
+    async def process_recall(self, query: str, project_ids: Optional[Union[str, List[str]]] = None, focus: Optional[str] = None, raw_fragments: bool = False, query_embedding: Optional[List[float]] = None) -> Dict[str, Any]:
         """Process recall with context awareness and optional synthesis."""
-        from ...models import SearchOptions
-        
         # search_memory now handles project_ids directly and returns grouped results
-        search_results_grouped = await self.memory.search_memory(query, project_ids)
+        with stage_timer("search", n_in=1, bytes_in=len(query)) as event:
+            search_results_grouped = await self.memory.search_memory(query, project_ids, query_embedding=query_embedding)
+            event["n_out"] = sum(
+                len(search_results_list)
+                for contexts_data in search_results_grouped.values()
+                for search_results_list in contexts_data.values()
+            )
 
         # Check if any results were found across all projects/contexts
         found_any_results = any(
@@ -86,7 +98,24 @@ class IntelligentMiddleware:
             }
             return response
 
-        # Synthesis logic (will receive grouped data in Phase 3.5)
-        synthesis = await self.synthesizer.synthesize_contextual(query, search_results_grouped) # Pass grouped data
+        # Reuse a previous synthesis when a similar query resolved to the same fragments.
+        # The query embedding is already in the embedding cache from the search above.
+        query_vector = query_embedding or await self.memory.embedding.generate_embedding(query)
+        cache_scope = SynthesisCache.scope_key(search_results_grouped)
+        fragment_hash = SynthesisCache.fragment_set_hash(search_results_grouped)
+        with stage_timer("synth", n_in=1, bytes_in=len(query), cache="hit") as event:
+            synthesis = self.synthesis_cache.get(query_vector, cache_scope, fragment_hash)
+            if synthesis is None:
+                event["cache"] = "miss"
+                # Synthesis logic (will receive grouped data in Phase 3.5)
+                synthesis = await self.synthesizer.synthesize_contextual(query, search_results_grouped) # Pass grouped data
+            event["n_out"] = 1
+            event["bytes_out"] = len(str(synthesis.get("synthesized_response", "")))
+
+        if event["cache"] == "hit":
+            logger.info(f"Returning cached synthesis for query: {query[:50]}...")
+        elif synthesis.get("synthesis_type") == "contextual":
+            # Only cache real contextual syntheses, never fallback responses
+            self.synthesis_cache.put(query_vector, cache_scope, fragment_hash, synthesis)
         response = {"success": True, **synthesis}
         return response
\ No newline at end of file
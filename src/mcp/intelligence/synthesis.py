@@ -12,6 +12,53 @@ from ...models import SearchResult
 
 logger = get_logger('memoire.mcp.intelligence')
 
+# Static prompt prefixes. Only the query/fragments part is formatted per call;
+# the instructions are sent first as their own part so that identical prefixes
+# across calls can be reused by Gemini's implicit prompt caching.
+_LEGACY_SYNTHESIS_PROMPT = """You are a memory synthesis assistant. Your job is to organize and synthesize information, NOT to make decisions or solve problems.
+
+Using the QUERY and RETRIEVED FRAGMENTS provided below, SYNTHESIZE a coherent response that:
+1. Directly addresses the query by organizing relevant information
+2. Combines information from fragments into a unified view
+3. Identifies relationships, patterns, and potential gaps
+4. Maintains neutrality - organize info without making recommendations
+5. Uses clear, domain-agnostic language suitable for any project type
+
+RESPOND WITH JSON:
+{
+    "synthesized_response": "A coherent explanation that organizes the retrieved information to address the query",
+    "confidence": 0.8,
+    "information_coverage": "complete|partial|sparse",
+    "gaps": ["missing info 1", "missing info 2"],
+    "patterns_identified": ["pattern 1", "pattern 2"],
+    "fragments_relevance": {'fragment_1': 'high', 'fragment_2': 'medium', 'fragment_3': 'low'}
+}
+
+Focus on synthesis and organization, not problem-solving.
+"""
+
+_CONTEXTUAL_SYNTHESIS_PROMPT = """You are an advanced memory synthesis assistant. Your task is to answer a query using the provided information with absolute fidelity.
+
+    INSTRUCTIONS:
+    1.  **Answer with Fidelity**: Construct a direct answer to the `QUERY` using ONLY the information from the `RETRIEVED AND GROUPED FRAGMENTS`.
+    2.  **Do Not Alter**: Do not summarize, paraphrase, or add outside information. Preserve the original wording and data.
+    3.  **Synthesize, Don't Hallucinate**: Combine the fragments into a coherent text. If the fragments do not contain the answer, state that the information is not available.
+    4.  **Leverage Context**: Use the project and context descriptions to understand and structure the information.
+    5.  **Output JSON**: Fill the `synthesized_response` field with your answer. Populate the other fields based on your analysis.
+
+    RESPOND WITH JSON:
+    {
+        "synthesized_response": "A coherent, context-aware explanation constructed directly from the provided fragments.",
+        "confidence": 0.9,
+        "information_coverage": "complete|partial|sparse",
+        "gaps": ["list any specific information the query asked for that was not found in the fragments"],
+        "patterns_identified": ["list any patterns or relationships you identified across fragments"],
+        "context_insights": ["list any insights about how contexts relate to each other"],
+        "fragments_relevance": {'fragment_1_id': 'high', 'fragment_2_id': 'medium'},
+        "recommended_contexts": ["list any contexts the user might want to explore further"]
+    }
+"""
+
 
 class MemorySynthesizer:
     """Handles synthesis of memory fragments into coherent responses."""
@@ -25,8 +72,8 @@ class MemorySynthesizer:
         self.config = config
         self.temperature = config.get("processing.temperature", 0.3)
         
-        # Subscribe to config changes for hot reload
-        config.add_observer(self._on_config_change)
+        # Subscribe to config changes for hot reload (weakly, so discarded synthesizers are not retained)
+        config.add_observer_weak(self._on_config_change)
         
         logger.info(f"MemorySynthesizer initialized with temperature: {self.temperature}")
         if memory_service:
@@ -51,40 +98,21 @@ class MemorySynthesizer:
         Maintains the same interface as the original intelligent_middleware.py
         """
         # Format fragments for analysis
-        fragments_text = ""
+        fragment_parts = []
         for i, fragment in enumerate(fragments, 1):
-            fragments_text += f"\nFragment {i}:\n"
-            fragments_text += f"Content: {fragment.fragment.content}\n"
-            fragments_text += f"Category: {fragment.fragment.category}\n"
-            fragments_text += f"Tags: {fragment.fragment.tags}\n"
-            fragments_text += f"Similarity: {fragment.similarity:.3f}\n"
+            fragment_parts.append(
+                f"\nFragment {i}:\n"
+                f"Content: {fragment.fragment.content}\n"
+                f"Category: {fragment.fragment.category}\n"
+                f"Tags: {fragment.fragment.tags}\n"
+                f"Similarity: {fragment.similarity:.3f}\n"
+            )
         
-        # Create synthesis prompt (domain-agnostic)
-        prompt = f"""You are a memory synthesis assistant. Your job is to organize and synthesize information, NOT to make decisions or solve problems.
-
-QUERY: {query}
-
-RETRIEVED FRAGMENTS:
-{fragments_text}
-
-SYNTHESIZE a coherent response that:
-1. Directly addresses the query by organizing relevant information
-2. Combines information from fragments into a unified view
-3. Identifies relationships, patterns, and potential gaps
-4. Maintains neutrality - organize info without making recommendations
-5. Uses clear, domain-agnostic language suitable for any project type
-
-RESPOND WITH JSON:
-{{
-    "synthesized_response": "A coherent explanation that organizes the retrieved information to address the query",
-    "confidence": 0.8,
-    "information_coverage": "complete|partial|sparse",
-    "gaps": ["missing info 1", "missing info 2"],
-    "patterns_identified": ["pattern 1", "pattern 2"],
-    "fragments_relevance": {{'fragment_1': 'high', 'fragment_2': 'medium', 'fragment_3': 'low'}}
-}}
-
-Focus on synthesis and organization, not problem-solving."""
+        # Create synthesis prompt (domain-agnostic): static instructions first, then the per-call data
+        prompt = [
+            _LEGACY_SYNTHESIS_PROMPT,
+            f"\nQUERY: {query}\n\nRETRIEVED FRAGMENTS:\n{''.join(fragment_parts)}"
+        ]
 
         try:
             # Use Gemini 2.5 Flash for synthesis
@@ -131,7 +159,7 @@ Focus on synthesis and organization, not problem-solving."""
             Synthesis result with context-aware insights
         """
         # Format fragments and contexts for the prompt
-        formatted_content = ""
+        content_parts = []
         all_contexts_info = {} # To store unique context descriptions
 
         for project_id, contexts_data in grouped_results.items():
@@ -139,8 +167,7 @@ Focus on synthesis and organization, not problem-solving."""
             project_name = project.name if project else project_id
             project_description = project.description if project else "No description available."
 
-            formatted_content += f"\n--- PROJECT: {project_name} (ID: {project_id}) ---"
-            formatted_content += f"\nDescription: {project_description}"
+            content_parts.append(f"\n--- PROJECT: {project_name} (ID: {project_id}) ---\nDescription: {project_description}")
 
             for context_id, search_results_list in contexts_data.items():
                 context = self.memory_service.get_context(context_id)
@@ -151,53 +178,40 @@ Focus on synthesis and organization, not problem-solving."""
                 if context_id not in all_contexts_info:
                     all_contexts_info[context_id] = {"name": context_name, "description": context_description}
 
-                formatted_content += f"\n---- CONTEXT: {context_name} (ID: {context_id}) ----"
-                formatted_content += f"\nDescription: {context_description}"
-
-                for i, sr in enumerate(search_results_list, 1):
-                    formatted_content += f"Fragment {i} (Similarity: {sr.similarity:.3f}):\n"
-                    formatted_content += f"Content: {sr.fragment.content}\n"
-                    formatted_content += f"Category: {sr.fragment.category}\n"
-                    formatted_content += f"Tags: {sr.fragment.tags}\n"
-                    formatted_content += "\n"
+                content_parts.append(f"\n---- CONTEXT: {context_name} (ID: {context_id}) ----\nDescription: {context_description}")
+
+                content_parts.extend(
+                    f"Fragment {i} (Similarity: {sr.similarity:.3f}):\n"
+                    f"Content: {sr.fragment.content}\n"
+                    f"Category: {sr.fragment.category}\n"
+                    f"Tags: {sr.fragment.tags}\n"
+                    "\n"
+                    for i, sr in enumerate(search_results_list, 1)
+                )
+        formatted_content = "".join(content_parts)
         
         # Prepare relevant contexts info for the prompt
         context_info_for_prompt = ""
         if all_contexts_info:
-            context_info_for_prompt = "\nRELEVANT CONTEXTS (with descriptions):\n"
-            for ctx_id, ctx_data in all_contexts_info.items():
-                context_info_for_prompt += f"- {ctx_data['name']} (ID: {ctx_id}): {ctx_data['description']}\n"
+            context_info_for_prompt = "\nRELEVANT CONTEXTS (with descriptions):\n" + "".join(
+                f"- {ctx_data['name']} (ID: {ctx_id}): {ctx_data['description']}\n"
+                for ctx_id, ctx_data in all_contexts_info.items()
+            )
         
-        prompt = f"""You are an advanced memory synthesis assistant. Your task is to answer a query using the provided information with absolute fidelity.
-
+        prompt = [
+            _CONTEXTUAL_SYNTHESIS_PROMPT,
+            f"""
     QUERY: {query}
 
     RETRIEVED AND GROUPED FRAGMENTS:
     {formatted_content}
-    {context_info_for_prompt}
-
-    INSTRUCTIONS:
-    1.  **Answer with Fidelity**: Construct a direct answer to the `QUERY` using ONLY the information from the `RETRIEVED AND GROUPED FRAGMENTS`.
-    2.  **Do Not Alter**: Do not summarize, paraphrase, or add outside information. Preserve the original wording and data.
-    3.  **Synthesize, Don't Hallucinate**: Combine the fragments into a coherent text. If the fragments do not contain the answer, state that the information is not available.
-    4.  **Leverage Context**: Use the project and context descriptions to understand and structure the information.
-    5.  **Output JSON**: Fill the `synthesized_response` field with your answer. Populate the other fields based on your analysis.
-
-    RESPOND WITH JSON:
-    {{
-        "synthesized_response": "A coherent, context-aware explanation constructed directly from the provided fragments.",
-        "confidence": 0.9,
-        "information_coverage": "complete|partial|sparse",
-        "gaps": ["list any specific information the query asked for that was not found in the fragments"],
-        "patterns_identified": ["list any patterns or relationships you identified across fragments"],
-        "context_insights": ["list any insights about how contexts relate to each other"],
-        "fragments_relevance": {{'fragment_1_id': 'high', 'fragment_2_id': 'medium'}},
-        "recommended_contexts": ["list any contexts the user might want to explore further"]
-    }}"""
+    {context_info_for_prompt}"""
+        ]
 
         try:
             model_name = self.config.get("processing.model", "gemini-2.5-flash-preview-05-20")
-            response = self.gemini_client.models.generate_content(
+            # Async client, so a recall timeout can cancel the request instead of blocking the event loop
+            response = await self.gemini_client.aio.models.generate_content(
                 model=model_name,
                 contents=prompt,
                 config={"temperature": self.temperature}  # Use hot-reloadable temperature
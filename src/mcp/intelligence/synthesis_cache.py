@@ -0,0 +1,87 @@
+"""
+Semantic cache for synthesis results.
+
+Recall queries that differ only in phrasing usually resolve to the same set of
+fragments. This cache stores synthesis results keyed by the normalized query
+embedding, the projects searched and a hash of the retrieved fragment set, so a
+near-duplicate query skips the Gemini synthesis call entirely.
+"""
+
+import hashlib
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from src.logging_config import get_logger
+from ...models import SearchResult
+from .vector_store import ScopedVectorStore
+
+logger = get_logger('memoire.mcp.intelligence')
+
+
+class SynthesisCache:
+    """In-memory synthesis cache with semantic (embedding) lookup."""
+
+    def __init__(self, similarity_threshold: float = 0.95, max_entries: int = 128):
+        """Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity between query embeddings for a hit
+            max_entries: Maximum number of entries kept across all project scopes
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        # scope -> query vectors with (fragment set hash, synthesis) payloads
+        self._store = ScopedVectorStore(max_entries)
+
+        logger.info(f"SynthesisCache initialized (threshold: {similarity_threshold}, max entries: {max_entries})")
+
+    @staticmethod
+    def scope_key(grouped_results: Dict[str, Dict[str, List[SearchResult]]]) -> str:
+        """Build the scope key from the projects present in the grouped results."""
+        return ",".join(sorted(grouped_results))
+
+    @staticmethod
+    def fragment_set_hash(grouped_results: Dict[str, Dict[str, List[SearchResult]]]) -> str:
+        """Hash the set of fragment IDs contained in the grouped results."""
+        fragment_ids = sorted(
+            sr.fragment.id
+            for contexts_data in grouped_results.values()
+            for search_results_list in contexts_data.values()
+            for sr in search_results_list
+        )
+        return hashlib.blake2b(",".join(fragment_ids).encode(), digest_size=16).hexdigest()
+
+    def get(self, query_vector: List[float], scope: str, fragment_hash: str) -> Optional[Dict[str, Any]]:
+        """Return a cached synthesis for a similar query over the same fragment set."""
+        entries = self._store.entries(scope)
+        if not entries:
+            return None
+
+        # Only entries synthesized from the same fragment set are candidates
+        same_fragments = np.fromiter((cached_hash == fragment_hash for cached_hash, _ in entries), dtype=bool, count=len(entries))
+        if not same_fragments.any():
+            return None
+
+        scores = np.where(same_fragments, self._store.scores(scope, query_vector), -1.0)
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+
+        if best_score >= self.similarity_threshold:
+            logger.debug(f"Synthesis cache hit (similarity: {best_score:.3f})")
+            return entries[best][1]
+        return None
+
+    def put(self, query_vector: List[float], scope: str, fragment_hash: str, synthesis: Dict[str, Any]) -> None:
+        """Store a synthesis result, evicting from the least recently used scope when full."""
+        self._store.add(scope, query_vector, (fragment_hash, synthesis))
+
+    def invalidate_project(self, project_id: str) -> None:
+        """Drop every cached entry whose scope includes the given project."""
+        dropped = self._store.drop_scopes(lambda scope: project_id in scope.split(","))
+        if dropped:
+            logger.debug(f"Synthesis cache invalidated {dropped} scopes for project {project_id}")
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        self._store.clear()
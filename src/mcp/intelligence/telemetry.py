@@ -0,0 +1,124 @@
+"""
+Pipeline telemetry for the intelligence layer.
+
+Records one structured event per pipeline stage (vector search, curation LLM call,
+synthesis, fragment deletion) with its latency and payload sizes. A per-session
+summary is logged on shutdown. Writing every event to
+`logs/intelligence_events.jsonl` is a measurement aid: the file is not rotated,
+so it is only enabled with `intelligence.telemetry_enabled`.
+"""
+
+import atexit
+import time
+import uuid
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Any, Literal
+
+from pydantic import BaseModel
+
+from src.logging_config import get_logger, LOGS_DIR
+from ...config import config
+
+logger = get_logger('memoire.mcp.intelligence')
+
+EVENTS_PATH = LOGS_DIR / "intelligence_events.jsonl"
+
+
+class PipelineEvent(BaseModel):
+    """A single timed stage of the intelligence pipeline."""
+    ts: float
+    session_id: str
+    stage: Literal["search", "curate", "synth", "delete"]
+    n_in: int = 0
+    n_out: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    latency_ms: float
+    cache: Literal["hit", "miss", "skip"] = "skip"
+
+
+class JsonlSink:
+    """Thread-safe append-only JSONL writer for pipeline events."""
+
+    def __init__(self, path=EVENTS_PATH):
+        self.path = path
+        self._lock = Lock()
+
+    def write(self, event: PipelineEvent) -> None:
+        line = event.model_dump_json() + "\n"
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class SessionSummary:
+    """Aggregates event counts and latencies per stage for the current session."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def add(self, event: PipelineEvent) -> None:
+        with self._lock:
+            stats = self._stages.setdefault(event.stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "cache_hits": 0})
+            stats["count"] += 1
+            stats["total_ms"] += event.latency_ms
+            stats["max_ms"] = max(stats["max_ms"], event.latency_ms)
+            if event.cache == "hit":
+                stats["cache_hits"] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                stage: {**stats, "avg_ms": stats["total_ms"] / stats["count"]}
+                for stage, stats in self._stages.items()
+            }
+
+    def log(self) -> None:
+        summary = self.as_dict()
+        if summary:
+            logger.info(f"Pipeline session {self.session_id} summary: {summary}")
+
+
+SESSION_ID = uuid.uuid4().hex
+_sink = JsonlSink()
+_summary = SessionSummary(SESSION_ID)
+atexit.register(_summary.log)
+
+
+def record_event(event: PipelineEvent) -> None:
+    """Add an event to the session summary and, when telemetry is enabled, write it to the sink."""
+    _summary.add(event)
+    if not config.get("intelligence.telemetry_enabled", False):
+        return
+    try:
+        _sink.write(event)
+    except Exception as e:
+        logger.warning(f"Failed to write pipeline event: {e}")
+
+
+@contextmanager
+def stage_timer(stage: str, n_in: int = 0, bytes_in: int = 0, cache: str = "skip"):
+    """Time a pipeline stage.
+
+    Yields a dict in which the caller can fill `n_out`, `bytes_out` and `cache`
+    before the block exits; the event is recorded even if the block raises.
+    """
+    details = {"n_out": 0, "bytes_out": 0, "cache": cache}
+    start = time.perf_counter()
+    try:
+        yield details
+    finally:
+        record_event(PipelineEvent(
+            ts=time.time(),
+            session_id=SESSION_ID,
+            stage=stage,
+            n_in=n_in,
+            n_out=details["n_out"],
+            bytes_in=bytes_in,
+            bytes_out=details["bytes_out"],
+            latency_ms=(time.perf_counter() - start) * 1000,
+            cache=details["cache"]
+        ))
@@ -0,0 +1,86 @@
+"""
+Scoped store of normalized query vectors for the semantic caches.
+
+Both the synthesis cache and the recall cache keep, per scope, a matrix of
+L2-normalized query embeddings with one payload per row, so a lookup scores
+every cached query of the scope with a single matrix-vector product.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+class ScopedVectorStore:
+    """Per-scope (N, D) float32 matrices of normalized vectors with row-aligned payloads.
+
+    The entry limit applies to the whole store: when it is exceeded, the oldest
+    entry of the least recently used scope is evicted, and empty scopes are dropped.
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of entries kept across all scopes
+        """
+        self.max_entries = max_entries
+        # scope -> (N, D) float32 matrix of L2-normalized vectors, oldest first
+        self._vectors: Dict[Hashable, np.ndarray] = {}
+        # scope -> payloads, row-aligned with the scope's matrix; least recently used scope first
+        self._entries: OrderedDict[Hashable, List[Any]] = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def entries(self, scope: Hashable) -> Optional[List[Any]]:
+        """Return the payloads of a scope, oldest first."""
+        return self._entries.get(scope)
+
+    def scores(self, scope: Hashable, query_vector: List[float]) -> np.ndarray:
+        """Cosine similarity of the query vector with every vector of the scope."""
+        self._entries.move_to_end(scope)
+        return self._vectors[scope] @ self.normalize(query_vector)
+
+    def add(self, scope: Hashable, vector: List[float], payload: Any) -> None:
+        """Append a vector and its payload, evicting from the least recently used scope when full."""
+        entries = self._entries.setdefault(scope, [])
+        self._entries.move_to_end(scope)
+        entries.append(payload)
+        row = self.normalize(vector)[np.newaxis, :]
+        vectors = self._vectors.get(scope)
+        self._vectors[scope] = row if vectors is None else np.vstack((vectors, row))
+        self._size += 1
+        while self._size > self.max_entries:
+            self.drop_oldest(next(iter(self._entries)), 1)
+
+    def drop_oldest(self, scope: Hashable, count: int) -> None:
+        """Remove the oldest entries of a scope, dropping the scope once it is empty."""
+        entries = self._entries[scope]
+        count = min(count, len(entries))
+        del entries[:count]
+        self._size -= count
+        if entries:
+            self._vectors[scope] = self._vectors[scope][count:]
+        else:
+            del self._entries[scope]
+            self._vectors.pop(scope, None)
+
+    def drop_scopes(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every scope matching the predicate; returns how many were removed."""
+        stale_scopes = [scope for scope in self._entries if predicate(scope)]
+        for scope in stale_scopes:
+            self._size -= len(self._entries.pop(scope))
+            self._vectors.pop(scope, None)
+        return len(stale_scopes)
+
+    def clear(self) -> None:
+        """Remove all scopes."""
+        self._entries.clear()
+        self._vectors.clear()
+        self._size = 0
@@ -3,10 +3,15 @@ Simplified natural language MCP handlers.
 The Cognitive Engine that interprets user intent and manages memory operations.
 """
 
+import asyncio
 import uuid
 from typing import Any, Dict, List, Optional, Union
 
 from src.logging_config import get_logger
+from src.config import config
+from ...models import Project
+from ...core.embedding import EmbeddingBatcher
+from .recall_cache import SemanticRecallCache
 
 logger = get_logger('memoire.mcp.cognitive_engine')
 
@@ -16,10 +21,57 @@ class CognitiveEngine:
     The cognitive engine that interprets natural language input and manages memory.
     """
 
+    __slots__ = (
+        'server', '_curate_and_chunk', '_process_recall', 'recall_cache', '_batcher',
+        '_project_cache', '_project_cache_version', '_projects_list_cache', '_projects_list_version'
+    )
+
     def __init__(self, server):
         self.server = server
+        # Middleware entry points resolved once; the middleware is created before the engine
+        self._curate_and_chunk = server.middleware.curate_and_chunk
+        self._process_recall = server.middleware.process_recall
+        self.recall_cache = SemanticRecallCache(
+            similarity_threshold=config.get("cache.recall_threshold", 0.92),
+            ttl_seconds=config.get("cache.recall_ttl_seconds", 900),
+            max_entries=config.get("cache.recall_max_entries", 256)
+        )
+        # Concurrent recalls share embedding calls
+        self._batcher = EmbeddingBatcher(
+            server.embedding,
+            max_batch=config.get("embedding.max_batch", 32),
+            max_wait_ms=config.get("embedding.max_wait_ms", 5)
+        )
+        # Project metadata cache, valid while storage.projects_version is unchanged
+        self._project_cache: Dict[str, Project] = {}
+        self._project_cache_version = -1
+        # Rendered list_projects result, valid while storage.projects_version is unchanged
+        self._projects_list_cache: Optional[List[Dict[str, str]]] = None
+        self._projects_list_version = -1
         logger.info("CognitiveEngine initialized")
 
+    def _sync_project_cache(self) -> None:
+        """Drop cached project metadata once storage reports a project change."""
+        storage_version = self.server.storage.projects_version
+        if storage_version != self._project_cache_version:
+            self._project_cache.clear()
+            self._project_cache_version = storage_version
+
+    def _get_project_cached(self, project_id: str) -> Optional[Project]:
+        """Get a project, hitting storage only on the first lookup after a project change."""
+        self._sync_project_cache()
+        project = self._project_cache.get(project_id)
+        if project is None:
+            project = self.server.memory.get_project(project_id)
+            if project:
+                self._project_cache[project_id] = project
+        return project
+
+    def _fetch_projects(self, project_ids: List[str]) -> List[Optional[Project]]:
+        """Storage lookups for projects missing from the cache; runs in a worker thread and leaves the cache alone."""
+        get_project = self.server.memory.get_project
+        return [get_project(pid) for pid in project_ids]
+
     async def remember(self, content: str, project_id: str, context: Optional[str] = None) -> Dict[str, Any]:
         """
         Store information in semantic memory using the enhanced intelligent workflow.
@@ -33,12 +85,16 @@ class CognitiveEngine:
             if not self._is_valid_uuid(project_id):
                 return {"success": False, "error": f"Invalid format for project_id: '{project_id}'. Must be a valid UUID."}
             
-            if not self.server.memory.get_project(project_id):
+            if not self._get_project_cached(project_id):
                 return {"success": False, "error": f"Project with ID '{project_id}' not found."}
 
             # --- End Validation ---
 
-            result = await self.server.middleware.curate_and_chunk(content, project_id)
+            try:
+                result = await self._curate_and_chunk(content, project_id)
+            finally:
+                # Curation may have written or deleted fragments even if it failed part way
+                self.recall_cache.invalidate_project(project_id)
 
             response = {
                 "success": True,
@@ -63,24 +119,89 @@ class CognitiveEngine:
             logger.error("Cannot recall: server is not ready.")
             raise RuntimeError("Services not ready")
 
+        timeout = config.get("intelligence.recall_timeout_seconds", 30)
         try:
-            validated_project_ids = None
+            ids_to_check = None
             if project_ids:
                 ids_to_check = [project_ids] if isinstance(project_ids, str) else project_ids
-                all_projects = self.server.memory.list_projects()
-                valid_id_set = {p.id for p in all_projects}
-                
-                validated_project_ids = [pid for pid in ids_to_check if pid in valid_id_set]
-                
-                if not validated_project_ids:
-                    return {"success": False, "error": "No valid project IDs provided.", "message": "Recall requires at least one valid project_id."}
-
-            result = await self.server.middleware.process_recall(query, validated_project_ids, focus, raw_fragments)
+
+            # Drop cached answers that may cover projects changed or deleted since they were computed
+            self.recall_cache.sync_projects_version(self.server.storage.projects_version)
+
+            # Exact repeats are answered before embedding the query
+            exact_scope = self.recall_cache.scope_key(ids_to_check, raw_fragments, focus)
+            cached = self.recall_cache.get_exact(exact_scope, query)
+            if cached is not None:
+                logger.info(f"Recall served from exact-match cache for query: {query[:50]}...")
+                return {**cached, "cache_hit": True}
+
+            # Projects are validated from the cache; only IDs missing from it need storage reads
+            validated_project_ids = None
+            uncached_ids = None
+            if ids_to_check:
+                self._sync_project_cache()
+                uncached_ids = [pid for pid in ids_to_check if pid not in self._project_cache]
+
+            if uncached_ids:
+                # Cold cache: the SQLite reads run in a worker thread alongside the query embedding call
+                cache_version = self._project_cache_version
+                projects, query_vector = await asyncio.gather(
+                    asyncio.to_thread(self._fetch_projects, uncached_ids),
+                    self._batcher.submit(query)
+                )
+                missing_ids = {pid for pid, project in zip(uncached_ids, projects) if not project}
+                # Don't cache lookups that may have raced a project change
+                if self._project_cache_version == cache_version == self.server.storage.projects_version:
+                    for pid, project in zip(uncached_ids, projects):
+                        if project:
+                            self._project_cache[pid] = project
+                validated_project_ids = [pid for pid in ids_to_check if pid not in missing_ids]
+            else:
+                query_vector = await self._batcher.submit(query)
+                if ids_to_check:
+                    validated_project_ids = list(ids_to_check)
+
+            if ids_to_check and not validated_project_ids:
+                return {"success": False, "error": "No valid project IDs provided.", "message": "Recall requires at least one valid project_id."}
+
+            # Paraphrases of a recently answered query are served from the semantic cache
+            cache_scope = self.recall_cache.scope_key(validated_project_ids, raw_fragments, focus)
+            cached = self.recall_cache.get(cache_scope, query_vector)
+            if cached is not None:
+                logger.info(f"Recall served from semantic cache for query: {query[:50]}...")
+                return {**cached, "cache_hit": True}
+
+            # A remember that lands while this recall runs makes its result stale; don't cache it then
+            generation = self.recall_cache.generation(cache_scope)
+            # Bound the search + synthesis latency; the pending Gemini request is cancelled on timeout
+            result = await asyncio.wait_for(
+                self._process_recall(query, validated_project_ids, focus, raw_fragments, query_embedding=query_vector),
+                timeout=timeout
+            )
+            if self._is_cacheable(result, raw_fragments) and self.recall_cache.generation(cache_scope) == generation:
+                self.recall_cache.put(cache_scope, query_vector, result)
+                self.recall_cache.put_exact(exact_scope, query, result)
             return result
+        except asyncio.TimeoutError:
+            logger.warning(f"Recall timed out after {timeout}s for query: {query[:50]}...")
+            return {"success": False, "error": f"Recall timed out after {timeout}s", "message": "Failed to recall memories"}
         except Exception as e:
             logger.error(f"Error in recall: {e}", exc_info=True)
             return {"success": False, "error": str(e), "message": "Failed to recall memories"}
 
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any], raw_fragments: bool) -> bool:
+        """Cache raw fragments, empty results and contextual syntheses, never fallback syntheses."""
+        if not result.get("success", False):
+            return False
+        if raw_fragments or "synthesized_response" not in result:
+            return True
+        return result.get("synthesis_type") == "contextual"
+
+    async def close(self) -> None:
+        """Stop background work owned by the engine."""
+        await self._batcher.close()
+
     def _is_valid_uuid(self, uuid_string: str) -> bool:
         try:
             uuid.UUID(uuid_string)
@@ -91,13 +212,22 @@ class CognitiveEngine:
     async def create_project(self, name: str, description: str) -> Optional[str]:
         """Create a new project via the memory service."""
         result = await self.server.memory.create_project(name, description)
+        if result:
+            # Warm the cache so the first remember/recall on the new project skips storage
+            self._get_project_cached(result)
         return result
 
     async def list_projects(self) -> List[Dict[str, str]]:
         """List all projects via the memory service."""
         try:
+            storage_version = self.server.storage.projects_version
+            if self._projects_list_cache is not None and self._projects_list_version == storage_version:
+                return self._projects_list_cache
+
             projects = self.server.memory.list_projects()
             project_list = [{ "id": p.id, "name": p.name, "description": p.description } for p in projects]
+            self._projects_list_cache = project_list
+            self._projects_list_version = storage_version
             return project_list
         except Exception as e:
             logger.error(f"Error in list_projects: {e}", exc_info=True)
@@ -124,14 +254,18 @@ class CognitiveEngine:
 
     async def delete_fragment(self, fragment_id: str) -> bool:
         """Delete a fragment by its ID."""
+        # The owning project is unknown here, so drop every cached recall
+        self.recall_cache.clear()
         return self.server.memory.delete_fragment(fragment_id)
 
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project by its ID."""
+        self.recall_cache.invalidate_project(project_id)
         return self.server.memory.delete_project(project_id)
 
     async def delete_context(self, project_id: str, context_id: str) -> bool:
         """Delete a context by its ID within a project."""
+        self.recall_cache.invalidate_project(project_id)
         return self.server.memory.delete_context(project_id, context_id)
 
     # ==================== TASK MANAGEMENT ====================
@@ -0,0 +1,153 @@
+"""
+Semantic cache for recall responses.
+
+Paraphrased recall queries ("what did I decide about X?" / "my decision on X?")
+produce nearly identical query embeddings. This cache returns the previous
+response for such queries, skipping the vector search and the LLM synthesis.
+Repeats of the exact same query are answered from an LRU before the query is
+even embedded.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.logging_config import get_logger
+from ..intelligence.vector_store import ScopedVectorStore
+
+logger = get_logger('memoire.mcp.recall_cache')
+
+# Scope of a cached recall: the searched project IDs (None for a global search), the raw_fragments flag and the focus
+CacheScope = Tuple[Optional[Tuple[str, ...]], bool, Optional[str]]
+
+
+class SemanticRecallCache:
+    """Process-local recall cache with embedding similarity lookup and TTL."""
+
+    def __init__(self, similarity_threshold: float = 0.92, ttl_seconds: float = 900, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity between query embeddings for a hit
+            ttl_seconds: Time to live for cache entries in seconds
+            max_entries: Maximum number of semantic entries kept across all scopes, and of exact-match entries
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # scope -> query vectors with (response, timestamp) payloads, oldest first
+        self._store = ScopedVectorStore(max_entries)
+        # (scope, normalized query digest) -> (response, timestamp), least recently used first
+        self._exact: OrderedDict[Tuple[CacheScope, bytes], Tuple[Dict[str, Any], float]] = OrderedDict()
+        # Invalidation counters: per project, and for global scopes (bumped by any project invalidation)
+        self._project_generations: Dict[str, int] = {}
+        self._global_generation = 0
+        # Bumped by clear(), which covers every scope
+        self._epoch = 0
+        # storage.projects_version the cached responses were computed under
+        self._projects_version: Optional[int] = None
+
+        logger.info(f"SemanticRecallCache initialized (threshold: {similarity_threshold}, ttl: {ttl_seconds}s)")
+
+    @staticmethod
+    def scope_key(project_ids: Optional[List[str]], raw_fragments: bool, focus: Optional[str] = None) -> CacheScope:
+        """Build the cache scope for a recall request."""
+        return (tuple(sorted(project_ids)) if project_ids else None, bool(raw_fragments), focus or None)
+
+    def generation(self, scope: CacheScope) -> Tuple[int, ...]:
+        """Snapshot of the invalidation counters covering the scope.
+
+        A response computed while the snapshot changed may predate new data and must not be stored.
+        """
+        if scope[0] is None:
+            return (self._epoch, self._global_generation)
+        return (self._epoch, *(self._project_generations.get(project_id, 0) for project_id in scope[0]))
+
+    def sync_projects_version(self, projects_version: int) -> None:
+        """Flush the cache when projects were created, updated or deleted since the last call.
+
+        Project deletions made outside the MCP server (e.g. from the GUI) never call invalidate_project.
+        """
+        if projects_version != self._projects_version:
+            if self._projects_version is not None:
+                self.clear()
+            self._projects_version = projects_version
+
+    @staticmethod
+    def _query_digest(query: str) -> bytes:
+        """Digest of the query with case and whitespace differences removed."""
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def get_exact(self, scope: CacheScope, query: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response of the same query in scope, if not expired."""
+        key = (scope, self._query_digest(query))
+        entry = self._exact.get(key)
+        if entry is None:
+            return None
+        response, timestamp = entry
+        if timestamp < time.monotonic() - self.ttl_seconds:
+            del self._exact[key]
+            return None
+        self._exact.move_to_end(key)
+        logger.debug("Recall cache exact hit")
+        return response
+
+    def put_exact(self, scope: CacheScope, query: str, response: Dict[str, Any]) -> None:
+        """Store a recall response for exact repeats of the query, evicting the least recently used entry when full."""
+        key = (scope, self._query_digest(query))
+        self._exact[key] = (response, time.monotonic())
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+    def get(self, scope: CacheScope, query_vector: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the cached response of the most similar query in scope, if similar enough."""
+        entries = self._store.entries(scope)
+        if not entries:
+            return None
+
+        # Drop expired entries (they are stored oldest first)
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = 0
+        while expired < len(entries) and entries[expired][1] < cutoff:
+            expired += 1
+        if expired:
+            self._store.drop_oldest(scope, expired)
+            if not entries:
+                return None
+
+        # One matrix-vector product scores every cached query of the scope
+        scores = self._store.scores(scope, query_vector)
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+
+        if best_score >= self.similarity_threshold:
+            logger.debug(f"Recall cache hit (similarity: {best_score:.3f})")
+            return entries[best][0]
+        return None
+
+    def put(self, scope: CacheScope, query_vector: List[float], response: Dict[str, Any]) -> None:
+        """Store a recall response, evicting from the least recently used scope when full."""
+        self._store.add(scope, query_vector, (response, time.monotonic()))
+
+    def invalidate_project(self, project_id: str) -> None:
+        """Drop cached responses that may include data from the given project."""
+        self._project_generations[project_id] = self._project_generations.get(project_id, 0) + 1
+        self._global_generation += 1
+        self._store.drop_scopes(lambda scope: scope[0] is None or project_id in scope[0])
+        stale_keys = [
+            key for key in self._exact
+            if key[0][0] is None or project_id in key[0][0]
+        ]
+        for key in stale_keys:
+            del self._exact[key]
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        self._store.clear()
+        self._exact.clear()
+        self._epoch += 1
@@ -4,27 +4,193 @@ No service initialization - uses shared instances from main process.
 """
 
 import asyncio
+import functools
 import json
-import logging
 from src.logging_config import get_logger
 import os
-import sys
 from typing import Dict, Any, List
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.server.models import InitializationOptions
 from mcp.server.lowlevel import NotificationOptions
 from mcp.types import Tool, TextContent
 
+from src.config import config
 from ..intelligence import IntelligentMiddleware
 from .cognitive_engine import CognitiveEngine
+from .tools import (
+    RestartServerTool, GetProjectSummaryTool, ListContextsTool,
+    ListFragmentsByContextTool, GetContextsForFragmentTool, DeleteFragmentTool, 
+    DeleteContextTool, DeleteProjectTool, CreateTaskTool, GetTaskTool, 
+    ListTasksTool, UpdateTaskTool, DeleteTaskTool
+)
 
 logger = get_logger('memoire.mcp.unified')
 
+# Use orjson's faster encoder for JSON tool responses when available
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _tool_from_model(name: str, model) -> Tool:
+    """Build an MCP Tool from a Pydantic tool model."""
+    schema = model.model_json_schema()
+    return Tool(
+        name=name,
+        description=schema.get('description', ''),
+        inputSchema={
+            "type": "object",
+            "properties": schema.get('properties', {}),
+            "required": schema.get('required', [])
+        }
+    )
+
+
+# Tool definitions are static, so they are built once at import and shared by every list_tools call
+_TOOLS: List[Tool] = [
+    Tool(
+        name="remember",
+        description="Store information in semantic memory with project segregation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "What to remember - facts, decisions, code, anything"
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project to store in (use 'default' for general memory)"
+                },
+                "context": {
+                    "type": "string", 
+                    "description": "Optional context about this memory"
+                }
+            },
+            "required": ["content", "project_id"]
+        }
+    ),
+    Tool(
+        name="recall",
+        description="Search memory and get synthesized response",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "What you want to know - natural language question"
+                },
+                "project_id": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Project(s) to search in (use 'default' for general memory, or an array of project IDs for multi-project search). If omitted, searches all projects."
+                },
+                "focus": {
+                    "type": "string",
+                    "description": "Optional focus area"
+                },
+                "raw_fragments": {
+                    "type": "boolean",
+                    "description": "If true, return raw fragment data instead of a synthesized response."
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="create_project",
+        description="Create a new memory project for domain segregation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Project name"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Project description"
+                }
+            },
+            "required": ["name", "description"]
+        }
+    ),
+    Tool(
+        name="list_projects",
+        description="List all available memory projects",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+] + [
+    _tool_from_model(name, model) for name, model in {
+        "get_project_summary": GetProjectSummaryTool,
+        "list_contexts": ListContextsTool,
+        "list_fragments_by_context": ListFragmentsByContextTool,
+        "get_contexts_for_fragment": GetContextsForFragmentTool,
+        "delete_fragment": DeleteFragmentTool,
+        "delete_context": DeleteContextTool,
+        "delete_project": DeleteProjectTool,
+        "create_task": CreateTaskTool,
+        "get_task": GetTaskTool,
+        "list_tasks": ListTasksTool,
+        "update_task": UpdateTaskTool,
+        "delete_task": DeleteTaskTool
+    }.items()
+]
+
+_RESTART_TOOL = Tool(
+    name="restart_server",
+    description=RestartServerTool.model_json_schema().get('description', 'Restarts the server.'),
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+)
+
+
+def _text(text: str) -> List[TextContent]:
+    """Wrap a response string as tool output, skipping model validation (the fields are always valid)."""
+    return [TextContent.model_construct(type="text", text=text)]
+
+
+# Fixed header, footer and empty text of the list_projects response, with the per-project line
+_PROJECTS_HEADER = "📁 Available Projects:\n"
+_PROJECTS_FOOTER = "Use these project IDs in remember/recall operations."
+_NO_PROJECTS = "No projects found. Create one with create_project()."
+_PROJECT_LINE = "• **{name}** (`{id}`)\n  {description}\n".format_map
+
+# Raw recall results with at least this many fragments are JSON-encoded in a worker thread
+_JSON_OFFLOAD_MIN_FRAGMENTS = 20
+
+# Responses with constant text are built once and shared
+_ERR_NAME_DESCRIPTION_REQUIRED = _text("Error: name and description are required")
+_ERR_CREATE_PROJECT_FAILED = _text("❌ Failed to create project")
+_RESTARTING = _text("✅ Server is restarting...")
+
+
+@functools.lru_cache(maxsize=64)
+def _unknown_tool_response(name: str) -> List[TextContent]:
+    return _text(f"Unknown tool: {name}")
+
 
 class UnifiedMemoireServer:
     """MCP server that uses shared services from main process."""
+
+    __slots__ = (
+        'storage', 'embedding', 'memory', 'middleware', 'cognitive_engine',
+        '_list_projects_key', '_list_projects_rendered', 'server', '_tool_dispatch', '_init_options',
+        '_pipeline_semaphore', '_ready'
+    )
     
     def __init__(self, storage, embedding, memory):
         # Use shared services directly
@@ -33,9 +199,16 @@ class UnifiedMemoireServer:
         self.memory = memory
         self.middleware = None
         self.cognitive_engine = None
+        # Last rendered list_projects response and the project data it was rendered from
+        self._list_projects_key = None
+        self._list_projects_rendered: List[TextContent] = []
         
         # Create MCP server
         self.server = Server("memoire")
+        self._init_options = None
+        self._pipeline_semaphore = None
+        # Set once initialize() has wired up every service
+        self._ready = False
         
         logger.info("Unified MCP server initialized with shared services")
 
@@ -44,14 +217,29 @@ class UnifiedMemoireServer:
         logger.debug("Entering initialize")
         try:
             logger.debug("Initializing IntelligentMiddleware")
-            self.middleware = IntelligentMiddleware(self.memory)
+            # Reads .env and builds the Gemini client; keep that blocking work off the event loop
+            self.middleware = await asyncio.to_thread(IntelligentMiddleware, self.memory)
             
             logger.debug("Initializing CognitiveEngine")
             self.cognitive_engine = CognitiveEngine(self)
             
+            # Bounds how many remember/recall pipelines (embedding + LLM calls) run at once
+            self._pipeline_semaphore = asyncio.Semaphore(config.get("intelligence.max_concurrent_pipelines", 8))
+            
             logger.debug("Registering MCP handlers")
             await self._register_handlers()
             
+            # Capabilities depend on the registered handlers, so build the options once they are in place
+            self._init_options = InitializationOptions(
+                server_name="memoire-unified",
+                server_version="0.1.0",
+                capabilities=self.server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={},
+                ),
+            )
+            
+            self._ready = True
             logger.info("✅ Unified MCP Server initialized successfully")
             return True
             
@@ -63,19 +251,11 @@ class UnifiedMemoireServer:
         """Register MCP protocol handlers."""
         logger.debug("Entering _register_handlers")
 
-        # Import all tools unconditionally to ensure they are in scope for handlers
-        from src.app import restart_server
-        from src.mcp.server.tools import (
-            RestartServerTool, GetProjectSummaryTool, ListContextsTool,
-            ListFragmentsByContextTool, GetContextsForFragmentTool, DeleteFragmentTool, 
-            DeleteContextTool, DeleteProjectTool, CreateTaskTool, GetTaskTool, 
-            ListTasksTool, UpdateTaskTool, DeleteTaskTool
-        )
-
         # Check for system tools
         system_tools_enabled = os.getenv('MEMOIRE_ENABLE_SYSTEM_Tools') == 'true'
         if system_tools_enabled:
             logger.warning("System tools are enabled. This is not recommended for production.")
+        tools = _TOOLS + [_RESTART_TOOL] if system_tools_enabled else _TOOLS
 
         # Register tools list handler
         @self.server.list_tools()
@@ -83,352 +263,237 @@ class UnifiedMemoireServer:
             """Return available tools."""
             logger.debug("Executing handle_list_tools")
             
-            base_tools = [
-                Tool(
-                    name="remember",
-                    description="Store information in semantic memory with project segregation",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "content": {
-                                "type": "string",
-                                "description": "What to remember - facts, decisions, code, anything"
-                            },
-                            "project_id": {
-                                "type": "string",
-                                "description": "Project to store in (use 'default' for general memory)"
-                            },
-                            "context": {
-                                "type": "string", 
-                                "description": "Optional context about this memory"
-                            }
-                        },
-                        "required": ["content", "project_id"]
-                    }
-                ),
-                Tool(
-                    name="recall",
-                    description="Search memory and get synthesized response",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "What you want to know - natural language question"
-                            },
-                            "project_id": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Project(s) to search in (use 'default' for general memory, or an array of project IDs for multi-project search). If omitted, searches all projects."
-                            },
-                            "focus": {
-                                "type": "string",
-                                "description": "Optional focus area"
-                            },
-                            "raw_fragments": {
-                                "type": "boolean",
-                                "description": "If true, return raw fragment data instead of a synthesized response."
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="create_project",
-                    description="Create a new memory project for domain segregation",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Project name"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Project description"
-                            }
-                        },
-                        "required": ["name", "description"]
-                    }
-                ),
-                Tool(
-                    name="list_projects",
-                    description="List all available memory projects",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                )
-            ]
-
-            # Add new tools from models
-            new_tool_models = {
-                "get_project_summary": GetProjectSummaryTool,
-                "list_contexts": ListContextsTool,
-                "list_fragments_by_context": ListFragmentsByContextTool,
-                "get_contexts_for_fragment": GetContextsForFragmentTool,
-                "delete_fragment": DeleteFragmentTool,
-                "delete_context": DeleteContextTool,
-                "delete_project": DeleteProjectTool,
-                "create_task": CreateTaskTool,
-                "get_task": GetTaskTool,
-                "list_tasks": ListTasksTool,
-                "update_task": UpdateTaskTool,
-                "delete_task": DeleteTaskTool
-            }
-
-            for name, model in new_tool_models.items():
-                schema = model.model_json_schema()
-                base_tools.append(Tool(
-                    name=name,
-                    description=schema.get('description', ''),
-                    inputSchema={
-                        "type": "object",
-                        "properties": schema.get('properties', {}),
-                        "required": schema.get('required', [])
-                    }
-                ))
-
-            if system_tools_enabled:
-                restart_tool_schema = RestartServerTool.model_json_schema()
-                base_tools.append(Tool(
-                    name="restart_server",
-                    description=restart_tool_schema.get('description', 'Restarts the server.'),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ))
-
-            return base_tools
+            return tools
         
+        # Build the tool dispatch table once; each tool has its own handler method
+        self._tool_dispatch = {
+            "remember": self._call_remember,
+            "recall": self._call_recall,
+            "create_project": self._call_create_project,
+            "list_projects": self._call_list_projects,
+            "get_project_summary": self._call_get_project_summary,
+            "list_contexts": self._call_list_contexts,
+            "list_fragments_by_context": self._call_list_fragments_by_context,
+            "get_contexts_for_fragment": self._call_get_contexts_for_fragment,
+            "delete_fragment": self._call_delete_fragment,
+            "delete_context": self._call_delete_context,
+            "delete_project": self._call_delete_project,
+            "create_task": self._call_create_task,
+            "get_task": self._call_get_task,
+            "list_tasks": self._call_list_tasks,
+            "update_task": self._call_update_task,
+            "delete_task": self._call_delete_task
+        }
+        if system_tools_enabled:
+            self._tool_dispatch["restart_server"] = self._call_restart_server
+
         # Register tool call handler
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls."""
-            logger.info(f"Received tool call: {name} with arguments: {arguments}")
-            logger.debug(f"Executing handle_call_tool for tool: '{name}' with arguments: {arguments}")
+            # Arguments can hold whole memories; only format them when debug logging is on
+            logger.info(f"Received tool call: {name}")
+            logger.debug("Tool call arguments for '%s': %s", name, arguments)
+            handler = self._tool_dispatch.get(name)
+            if handler is None:
+                logger.warning(f"Unknown tool called: {name}")
+                return _unknown_tool_response(name)
             try:
-                if name == "remember":
-                    content = arguments.get("content")
-                    project_id = arguments.get("project_id")
-                    context = arguments.get("context")
-                    result = await self.cognitive_engine.remember(content, project_id, context)
-                    
-                    response_text = result.get("message", "Memory stored successfully")
-                    if not result.get("success", False):
-                        response_text = f"❌ Error: {result.get('error', 'Unknown error')}"
-
-                    return [TextContent(type="text", text=response_text)]
-                    
-                elif name == "recall":
-                    query = arguments.get("query")
-                    project_ids = arguments.get("project_id")
-                    focus = arguments.get("focus")
-                    raw_fragments = arguments.get("raw_fragments", False)
-                    result = await self.cognitive_engine.recall(query, project_ids, focus, raw_fragments)
-                    
-                    if result.get("success", False):
-                        if raw_fragments:
-                            response_text = json.dumps(result.get("grouped_fragments", {}), indent=2)
-                        else:
-                            response_text = result.get("synthesized_response", "No information found")
-                    else:
-                        response_text = f"❌ Error: {result.get('error', 'Failed to recall information')}"
-
-                    return [TextContent(type="text", text=response_text)]
-                
-                elif name == "create_project":
-                    name_param = arguments.get("name")
-                    description = arguments.get("description")
-                    
-                    if not name_param or not description:
-                        return [TextContent(type="text", text="Error: name and description are required")]
-                    
-                    project_id = await self.cognitive_engine.create_project(name_param, description)
-                    
-                    if project_id:
-                        response_text = f"✅ Created project '{name_param}' with ID: {project_id}"
-                    else:
-                        response_text = "❌ Failed to create project"
-                    
-                    return [TextContent(type="text", text=response_text)]
-                
-                elif name == "list_projects":
-                    projects = await self.cognitive_engine.list_projects()
-                    
-                    if projects:
-                        response_text = "📁 Available Projects:\n\n"
-                        for project in projects:
-                            response_text += f"• **{project['name']}** (`{project['id']}`)\n"
-                            response_text += f"  {project['description']}\n\n"
-                        response_text += "Use these project IDs in remember/recall operations."
-                    else:
-                        response_text = "No projects found. Create one with create_project()."
-                    
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "get_project_summary":
-                    project_id = arguments.get("project_id")
-                    summary = await self.cognitive_engine.get_project_summary(project_id)
-                    if summary:
-                        task_counts = summary.get('tasks', {})
-                        response_text = (
-                            f"📊 Summary for project '{project_id}':\n"
-                            f"  - Contexts: {summary['contexts']} \n"
-                            f"  - Fragments: {summary['fragments']} \n"
-                            f"  - Tasks: {sum(task_counts.values())} "
-                            f"({task_counts.get('pending', 0)} pending, "
-                            f"{task_counts.get('in_progress', 0)} in_progress, "
-                            f"{task_counts.get('completed', 0)} completed)"
-                        )
-                    else:
-                        response_text = f"❌ Project with ID '{project_id}' not found."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "list_contexts":
-                    project_id = arguments.get("project_id")
-                    contexts = await self.cognitive_engine.list_contexts(project_id)
-                    if contexts:
-                        response_text = f"📚 Contexts in project '{project_id}':\n"
-                        for ctx in contexts:
-                            response_text += f"  - {ctx['name']} (`{ctx['id']}`)\n"
-                    else:
-                        response_text = f"No contexts found in project with ID '{project_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "list_fragments_by_context":
-                    project_id = arguments.get("project_id")
-                    context_id = arguments.get("context_id")
-                    fragments = await self.cognitive_engine.list_fragments_by_context(project_id, context_id)
-                    if fragments:
-                        response_text = f"📄 Fragments in context '{context_id}':\n"
-                        for frag in fragments:
-                            response_text += f"  - `{frag['id']}`: {frag['content'][:80]}...\n"
-                    else:
-                        response_text = f"No fragments found in context '{context_id}'."
-                    return [TextContent(type="text", text=response_text)]
-                
-                elif name == "get_contexts_for_fragment":
-                    fragment_id = arguments.get("fragment_id")
-                    contexts = await self.cognitive_engine.get_contexts_for_fragment(fragment_id)
-                    if contexts:
-                        response_text = f"📚 Contexts containing fragment '{fragment_id}':\n"
-                        for ctx in contexts:
-                            response_text += f"  - {ctx['name']} (`{ctx['id']}`)\n"
-                    else:
-                        response_text = f"No contexts found for fragment '{fragment_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "delete_fragment":
-                    fragment_id = arguments.get("fragment_id")
-                    success = await self.cognitive_engine.delete_fragment(fragment_id)
-                    response_text = f"✅ Fragment '{fragment_id}' deleted." if success else f"❌ Failed to delete fragment '{fragment_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "delete_context":
-                    project_id = arguments.get("project_id")
-                    context_id = arguments.get("context_id")
-                    success = await self.cognitive_engine.delete_context(project_id, context_id)
-                    response_text = f"✅ Context '{context_id}' deleted." if success else f"❌ Failed to delete context '{context_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "delete_project":
-                    project_id = arguments.get("project_id")
-                    success = await self.cognitive_engine.delete_project(project_id)
-                    response_text = f"✅ Project '{project_id}' deleted." if success else f"❌ Failed to delete project '{project_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "create_task":
-                    project_id = arguments.get("project_id")
-                    title = arguments.get("title")
-                    description = arguments.get("description")
-                    task_id = await self.cognitive_engine.create_task(project_id, title, description)
-                    response_text = f"✅ Task created with ID: {task_id}" if task_id else "❌ Failed to create task."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "get_task":
-                    task_id = arguments.get("task_id")
-                    task = await self.cognitive_engine.get_task(task_id)
-                    response_text = json.dumps(task, indent=2) if task else f"❌ Task '{task_id}' not found."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "list_tasks":
-                    project_id = arguments.get("project_id")
-                    status = arguments.get("status")
-                    tasks = await self.cognitive_engine.list_tasks(project_id, status)
-                    response_text = json.dumps(tasks, indent=2)
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "update_task":
-                    task_id = arguments.get("task_id")
-                    title = arguments.get("title")
-                    description = arguments.get("description")
-                    status = arguments.get("status")
-                    success = await self.cognitive_engine.update_task(task_id, title, description, status)
-                    response_text = f"✅ Task '{task_id}' updated." if success else f"❌ Failed to update task '{task_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "delete_task":
-                    task_id = arguments.get("task_id")
-                    success = await self.cognitive_engine.delete_task(task_id)
-                    response_text = f"✅ Task '{task_id}' deleted." if success else f"❌ Failed to delete task '{task_id}'."
-                    return [TextContent(type="text", text=response_text)]
-
-                elif name == "restart_server" and system_tools_enabled:
-                    logger.warning("Executing restart_server tool.")
-                    # Respond to the client FIRST, then restart.
-                    # Add a small delay to ensure the message is sent before shutdown.
-                    asyncio.create_task(self.schedule_restart(restart_server))
-                    return [TextContent(type="text", text="✅ Server is restarting...")]
-
-                else:
-                    logger.warning(f"Unknown tool called: {name}")
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-                    
+                return await handler(arguments)
             except Exception as e:
                 logger.error(f"Error handling tool call '{name}': {e}", exc_info=True)
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+                return _text(f"Error: {str(e)}")
         
         logger.info("✅ Unified MCP handlers registered: list_tools, call_tool")
         logger.debug("Exiting _register_handlers")
 
-    async def schedule_restart(self, restart_function):
-        """Schedules the server restart after a short delay."""
-        await asyncio.sleep(0.1)  # Delay to allow response to be sent
-        restart_function()
-
-    def is_ready(self) -> bool:
-        """Check if all services are ready."""
-        ready_status = all([
-            self.storage, self.embedding, self.memory, 
-            self.middleware, self.cognitive_engine
-        ])
-        return ready_status
-    
-    async def run(self):
-        """Run the unified MCP server."""
-        logger.info("🚀 Starting Unified Memoire MCP Server...")
-        try:
-            async with stdio_server() as (read_stream, write_stream):
-                logger.info("📞 Connected to stdio, running server loop.")
-                await self.server.run(
-                    read_stream, 
-                    write_stream,
-                    InitializationOptions(
-                        server_name="memoire-unified",
-                        server_version="0.1.0",
-                        capabilities=self.server.get_capabilities(
-                            notification_options=NotificationOptions(),
-                            experimental_capabilities={},
-                        ),
-                    ),
+    async def _call_remember(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        get_arg = arguments.get
+        content, project_id, context = get_arg("content"), get_arg("project_id"), get_arg("context")
+        async with self._pipeline_semaphore:
+            result = await self.cognitive_engine.remember(content, project_id, context)
+        
+        # Only the fields of the taken branch are read from the result
+        get_result = result.get
+        if get_result("success", False):
+            response_text = get_result("message", "Memory stored successfully")
+        else:
+            response_text = f"❌ Error: {get_result('error', 'Unknown error')}"
+
+        return _text(response_text)
+
+    async def _call_recall(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        get_arg = arguments.get
+        query, project_ids, focus = get_arg("query"), get_arg("project_id"), get_arg("focus")
+        raw_fragments = get_arg("raw_fragments", False)
+        async with self._pipeline_semaphore:
+            result = await self.cognitive_engine.recall(query, project_ids, focus, raw_fragments)
+        
+        get_result = result.get
+        if get_result("success", False):
+            if raw_fragments:
+                grouped_fragments = get_result("grouped_fragments", {})
+                fragment_count = sum(
+                    len(fragments) for contexts in grouped_fragments.values() for fragments in contexts.values()
                 )
-        except Exception as e:
-            logger.critical(f"Fatal error running unified MCP server: {e}", exc_info=True)
+                if fragment_count >= _JSON_OFFLOAD_MIN_FRAGMENTS:
+                    # Multi-KB payloads would otherwise stall the event loop while encoding
+                    response_text = await asyncio.to_thread(_dumps, grouped_fragments)
+                else:
+                    response_text = _dumps(grouped_fragments)
+            else:
+                response_text = get_result("synthesized_response", "No information found")
+        else:
+            response_text = f"❌ Error: {get_result('error', 'Failed to recall information')}"
+
+        return _text(response_text)
 
+    async def _call_create_project(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        name_param = arguments.get("name")
+        description = arguments.get("description")
+        
+        if not name_param or not description:
+            return _ERR_NAME_DESCRIPTION_REQUIRED
+        
+        project_id = await self.cognitive_engine.create_project(name_param, description)
+        
+        if not project_id:
+            return _ERR_CREATE_PROJECT_FAILED
+        
+        return _text(f"✅ Created project '{name_param}' with ID: {project_id}")
+
+    async def _call_list_projects(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        projects = await self.cognitive_engine.list_projects()
+        key = tuple((p['id'], p['name'], p['description']) for p in projects)
+        if key == self._list_projects_key:
+            return self._list_projects_rendered
+        
+        if projects:
+            parts = [_PROJECTS_HEADER]
+            parts.extend(map(_PROJECT_LINE, projects))
+            parts.append(_PROJECTS_FOOTER)
+            response_text = "\n".join(parts)
+        else:
+            response_text = _NO_PROJECTS
+        
+        self._list_projects_key = key
+        self._list_projects_rendered = _text(response_text)
+        return self._list_projects_rendered
+
+    async def _call_get_project_summary(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        summary = await self.cognitive_engine.get_project_summary(project_id)
+        if summary:
+            task_counts = summary.get('tasks', {})
+            response_text = (
+                f"📊 Summary for project '{project_id}':\n"
+                f"  - Contexts: {summary['contexts']} \n"
+                f"  - Fragments: {summary['fragments']} \n"
+                f"  - Tasks: {sum(task_counts.values())} "
+                f"({task_counts.get('pending', 0)} pending, "
+                f"{task_counts.get('in_progress', 0)} in_progress, "
+                f"{task_counts.get('completed', 0)} completed)"
+            )
+        else:
+            response_text = f"❌ Project with ID '{project_id}' not found."
+        return _text(response_text)
+
+    async def _call_list_contexts(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        contexts = await self.cognitive_engine.list_contexts(project_id)
+        if contexts:
+            response_text = f"📚 Contexts in project '{project_id}':\n" + "".join(
+                f"  - {ctx['name']} (`{ctx['id']}`)\n" for ctx in contexts
+            )
+        else:
+            response_text = f"No contexts found in project with ID '{project_id}'."
+        return _text(response_text)
+
+    async def _call_list_fragments_by_context(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        context_id = arguments.get("context_id")
+        fragments = await self.cognitive_engine.list_fragments_by_context(project_id, context_id)
+        if fragments:
+            response_text = f"📄 Fragments in context '{context_id}':\n" + "".join(
+                f"  - `{frag['id']}`: {frag['content'][:80]}...\n" for frag in fragments
+            )
+        else:
+            response_text = f"No fragments found in context '{context_id}'."
+        return _text(response_text)
+
+    async def _call_get_contexts_for_fragment(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        fragment_id = arguments.get("fragment_id")
+        contexts = await self.cognitive_engine.get_contexts_for_fragment(fragment_id)
+        if contexts:
+            response_text = f"📚 Contexts containing fragment '{fragment_id}':\n" + "".join(
+                f"  - {ctx['name']} (`{ctx['id']}`)\n" for ctx in contexts
+            )
+        else:
+            response_text = f"No contexts found for fragment '{fragment_id}'."
+        return _text(response_text)
+
+    async def _call_delete_fragment(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        fragment_id = arguments.get("fragment_id")
+        success = await self.cognitive_engine.delete_fragment(fragment_id)
+        response_text = f"✅ Fragment '{fragment_id}' deleted." if success else f"❌ Failed to delete fragment '{fragment_id}'."
+        return _text(response_text)
+
+    async def _call_delete_context(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        context_id = arguments.get("context_id")
+        success = await self.cognitive_engine.delete_context(project_id, context_id)
+        response_text = f"✅ Context '{context_id}' deleted." if success else f"❌ Failed to delete context '{context_id}'."
+        return _text(response_text)
+
+    async def _call_delete_project(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        success = await self.cognitive_engine.delete_project(project_id)
+        response_text = f"✅ Project '{project_id}' deleted." if success else f"❌ Failed to delete project '{project_id}'."
+        return _text(response_text)
+
+    async def _call_create_task(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        title = arguments.get("title")
+        description = arguments.get("description")
+        task_id = await self.cognitive_engine.create_task(project_id, title, description)
+        response_text = f"✅ Task created with ID: {task_id}" if task_id else "❌ Failed to create task."
+        return _text(response_text)
+
+    async def _call_get_task(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        task_id = arguments.get("task_id")
+        task = await self.cognitive_engine.get_task(task_id)
+        response_text = _dumps(task) if task else f"❌ Task '{task_id}' not found."
+        return _text(response_text)
+
+    async def _call_list_tasks(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        project_id = arguments.get("project_id")
+        status = arguments.get("status")
+        tasks = await self.cognitive_engine.list_tasks(project_id, status)
+        response_text = _dumps(tasks)
+        return _text(response_text)
+
+    async def _call_update_task(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        task_id = arguments.get("task_id")
+        title = arguments.get("title")
+        description = arguments.get("description")
+        status = arguments.get("status")
+        success = await self.cognitive_engine.update_task(task_id, title, description, status)
+        response_text = f"✅ Task '{task_id}' updated." if success else f"❌ Failed to update task '{task_id}'."
+        return _text(response_text)
+
+    async def _call_delete_task(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        task_id = arguments.get("task_id")
+        success = await self.cognitive_engine.delete_task(task_id)
+        response_text = f"✅ Task '{task_id}' deleted." if success else f"❌ Failed to delete task '{task_id}'."
+        return _text(response_text)
+
+    async def _call_restart_server(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        from src.app import restart_server
+        logger.warning("Executing restart_server tool.")
+        # Respond to the client FIRST, then restart.
+        # Add a small delay to ensure the message is sent before shutdown.
+        asyncio.create_task(self.schedule_restart(restart_server))
+        return _RESTARTING
 
     async def schedule_restart(self, restart_function):
         """Schedules the server restart after a short delay."""
@@ -437,29 +502,23 @@ class UnifiedMemoireServer:
 
     def is_ready(self) -> bool:
         """Check if all services are ready."""
-        ready_status = all([
-            self.storage, self.embedding, self.memory, 
-            self.middleware, self.cognitive_engine
-        ])
-        return ready_status
+        return self._ready
     
     async def run(self):
         """Run the unified MCP server."""
         logger.info("🚀 Starting Unified Memoire MCP Server...")
+        # Only needed once the transport starts, so it stays out of the module import
+        from mcp.server.stdio import stdio_server
         try:
             async with stdio_server() as (read_stream, write_stream):
                 logger.info("📞 Connected to stdio, running server loop.")
                 await self.server.run(
                     read_stream, 
                     write_stream,
-                    InitializationOptions(
-                        server_name="memoire-unified",
-                        server_version="0.1.0",
-                        capabilities=self.server.get_capabilities(
-                            notification_options=NotificationOptions(),
-                            experimental_capabilities={},
-                        ),
-                    ),
+                    self._init_options,
                 )
         except Exception as e:
             logger.critical(f"Fatal error running unified MCP server: {e}", exc_info=True)
+        finally:
+            if self.cognitive_engine is not None:
+                await self.cognitive_engine.close()
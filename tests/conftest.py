@@ -0,0 +1,51 @@
+"""Shared fixtures for the memoire test suite."""
+
+from typing import Dict, List
+
+import pytest
+
+from src.core.embedding import EmbeddingService
+from src.core.embedding.providers import EmbeddingProvider
+
+
+class FakeProvider(EmbeddingProvider):
+    """Embedding provider that gives each distinct text its own one-hot vector and records its calls."""
+
+    def __init__(self, dimension: int = 16):
+        self.dimension = dimension
+        self.vectors: Dict[str, List[float]] = {}
+        self.calls: List[List[str]] = []
+        # When set, batch calls return this many vectors fewer than requested
+        self.drop_vectors = 0
+
+    def _vector(self, text: str) -> List[float]:
+        if text not in self.vectors:
+            vector = [0.0] * self.dimension
+            vector[len(self.vectors) % self.dimension] = 1.0
+            self.vectors[text] = vector
+        return self.vectors[text]
+
+    async def generate_embedding(self, text: str, task_type: str = None) -> List[float]:
+        self.calls.append([text])
+        return self._vector(text)
+
+    async def generate_embeddings(self, texts: List[str], task_type: str = None) -> List[List[float]]:
+        self.calls.append(list(texts))
+        embeddings = [self._vector(text) for text in texts]
+        return embeddings[:len(embeddings) - self.drop_vectors]
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+    def get_model_name(self) -> str:
+        return "fake-embedding"
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture
+def embedding_service(provider):
+    return EmbeddingService(provider=provider, cache_ttl_hours=1)
@@ -0,0 +1,192 @@
+"""Tests for recall caching and invalidation in the cognitive engine."""
+
+import asyncio
+import uuid
+
+import pytest
+
+from src.models import Project
+from src.mcp.server.cognitive_engine import CognitiveEngine
+
+CONTEXTUAL = {"success": True, "synthesized_response": "answer", "synthesis_type": "contextual"}
+
+
+class FakeStorage:
+    def __init__(self):
+        self.projects_version = 0
+
+
+class FakeMemory:
+    def __init__(self, storage):
+        self.storage = storage
+        self.projects = {}
+
+    def add_project(self, name="Project"):
+        project = Project(name=name, description="test project")
+        self.projects[project.id] = project
+        self.storage.projects_version += 1
+        return project.id
+
+    def delete_project(self, project_id):
+        # Same order as StorageManager: write first, then bump the version
+        del self.projects[project_id]
+        self.storage.projects_version += 1
+
+    def get_project(self, project_id):
+        return self.projects.get(project_id)
+
+
+class FakeMiddleware:
+    def __init__(self):
+        self.recall_calls = 0
+        self.recall_result = CONTEXTUAL
+        self.curate_error = None
+        # When set, process_recall waits for it before returning
+        self.recall_gate = None
+
+    async def curate_and_chunk(self, content, project_id):
+        if self.curate_error:
+            raise self.curate_error
+        return {"created_fragment_ids": ["f1"]}
+
+    async def process_recall(self, query, project_ids=None, focus=None, raw_fragments=False, query_embedding=None):
+        self.recall_calls += 1
+        if self.recall_gate is not None:
+            await self.recall_gate.wait()
+        return dict(self.recall_result)
+
+
+class FakeServer:
+    def __init__(self, embedding):
+        self.storage = FakeStorage()
+        self.memory = FakeMemory(self.storage)
+        self.middleware = FakeMiddleware()
+        self.embedding = embedding
+
+    def is_ready(self):
+        return True
+
+
+@pytest.fixture
+async def server(embedding_service):
+    server = FakeServer(embedding_service)
+    server.cognitive_engine = CognitiveEngine(server)
+    yield server
+    await server.cognitive_engine.close()
+
+
+async def test_repeated_recall_is_served_from_cache(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+
+    first = await engine.recall("what did I decide?", project_id)
+    second = await engine.recall("What did I decide?", project_id)
+
+    assert server.middleware.recall_calls == 1
+    assert "cache_hit" not in first
+    assert second["cache_hit"] is True
+    assert second["synthesized_response"] == "answer"
+
+
+async def test_remember_invalidates_cached_recall(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+
+    await engine.recall("what did I decide?", project_id)
+    result = await engine.remember("new decision", project_id)
+    await engine.recall("what did I decide?", project_id)
+
+    assert result["success"] is True
+    assert server.middleware.recall_calls == 2
+
+
+async def test_failed_remember_still_invalidates_cached_recall(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+    await engine.recall("what did I decide?", project_id)
+
+    server.middleware.curate_error = RuntimeError("curation failed after writing")
+    result = await engine.remember("new decision", project_id)
+    await engine.recall("what did I decide?", project_id)
+
+    assert result["success"] is False
+    assert server.middleware.recall_calls == 2
+
+
+async def test_recall_racing_remember_is_not_cached(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+    server.middleware.recall_gate = asyncio.Event()
+
+    pending = asyncio.create_task(engine.recall("what did I decide?", project_id))
+    while server.middleware.recall_calls == 0:
+        await asyncio.sleep(0)
+    await engine.remember("new decision", project_id)
+    server.middleware.recall_gate.set()
+    await pending
+
+    await engine.recall("what did I decide?", project_id)
+    assert server.middleware.recall_calls == 2
+
+
+async def test_external_project_deletion_flushes_cached_recall(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+    await engine.recall("what did I decide?", project_id)
+
+    # Deleted outside the MCP server (e.g. from the GUI): no invalidate_project call
+    server.memory.delete_project(project_id)
+    result = await engine.recall("what did I decide?", project_id)
+
+    assert result["success"] is False
+    assert "No valid project IDs" in result["error"]
+
+
+async def test_external_project_change_flushes_global_recall(server):
+    engine = server.cognitive_engine
+    server.memory.add_project()
+    await engine.recall("what did I decide?")
+
+    server.memory.add_project("Created from the GUI")
+    result = await engine.recall("what did I decide?")
+
+    assert "cache_hit" not in result
+    assert server.middleware.recall_calls == 2
+
+
+async def test_unknown_project_ids_are_rejected(server):
+    result = await server.cognitive_engine.recall("anything", str(uuid.uuid4()))
+
+    assert result["success"] is False
+    assert server.middleware.recall_calls == 0
+
+
+async def test_fallback_synthesis_is_not_cached(server):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+    server.middleware.recall_result = {
+        "success": True,
+        "synthesized_response": "Found 3 relevant fragments. Manual review recommended.",
+        "gaps": ["synthesis processing error"],
+    }
+
+    await engine.recall("what did I decide?", project_id)
+    await engine.recall("what did I decide?", project_id)
+
+    assert server.middleware.recall_calls == 2
+
+
+@pytest.mark.parametrize("raw_fragments, recall_result", [
+    (True, {"success": True, "response": "Raw fragments retrieved successfully.", "grouped_fragments": {}}),
+    (False, {"success": True, "response": "No information found."}),
+])
+async def test_raw_and_empty_results_are_cached(server, raw_fragments, recall_result):
+    engine = server.cognitive_engine
+    project_id = server.memory.add_project()
+    server.middleware.recall_result = recall_result
+
+    await engine.recall("what did I decide?", project_id, raw_fragments=raw_fragments)
+    second = await engine.recall("what did I decide?", project_id, raw_fragments=raw_fragments)
+
+    assert server.middleware.recall_calls == 1
+    assert second["cache_hit"] is True
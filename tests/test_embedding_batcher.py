@@ -0,0 +1,62 @@
+"""Tests for embedding micro-batching."""
+
+import asyncio
+
+import pytest
+
+from src.core.embedding import EmbeddingBatcher
+
+
+async def test_concurrent_requests_share_one_provider_call(provider, embedding_service):
+    batcher = EmbeddingBatcher(embedding_service, max_batch=8, max_wait_ms=20)
+    try:
+        results = await asyncio.gather(*(batcher.submit(text) for text in ["a", "b", "a", "c"]))
+    finally:
+        await batcher.close()
+
+    assert provider.calls == [["a", "b", "c"]]
+    assert results[0] == results[2] == provider.vectors["a"]
+    assert results[1] == provider.vectors["b"]
+    assert results[3] == provider.vectors["c"]
+
+
+async def test_cached_text_skips_the_queue(provider, embedding_service):
+    embedding_service.cache.set("a", embedding_service.model, [1.0, 2.0])
+    batcher = EmbeddingBatcher(embedding_service)
+
+    assert await batcher.submit("a") == [1.0, 2.0]
+    assert provider.calls == []
+
+
+async def test_short_provider_response_fails_every_waiter(provider, embedding_service):
+    provider.drop_vectors = 1
+    batcher = EmbeddingBatcher(embedding_service, max_batch=8, max_wait_ms=20)
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=2
+        )
+    finally:
+        await batcher.close()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_provider_error_fails_waiters_and_worker_keeps_running(provider, embedding_service):
+    batcher = EmbeddingBatcher(embedding_service, max_wait_ms=1)
+    provider.drop_vectors = 1
+    try:
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(batcher.submit("a"), timeout=2)
+
+        provider.drop_vectors = 0
+        assert await asyncio.wait_for(batcher.submit("b"), timeout=2) == provider.vectors["b"]
+    finally:
+        await batcher.close()
+
+
+async def test_empty_text_is_rejected(embedding_service):
+    batcher = EmbeddingBatcher(embedding_service)
+
+    with pytest.raises(ValueError):
+        await batcher.submit("   ")
@@ -0,0 +1,107 @@
+"""Tests for the semantic recall cache."""
+
+from src.mcp.server import recall_cache as recall_cache_module
+from src.mcp.server.recall_cache import SemanticRecallCache
+
+RESPONSE = {"success": True, "synthesized_response": "answer"}
+
+
+def make_cache(**kwargs):
+    return SemanticRecallCache(similarity_threshold=0.9, **kwargs)
+
+
+def test_semantic_hit_requires_similar_query_in_same_scope():
+    cache = make_cache()
+    scope = cache.scope_key(["p1"], False)
+    cache.put(scope, [1.0, 0.0], RESPONSE)
+
+    assert cache.get(scope, [1.0, 0.1]) is RESPONSE
+    assert cache.get(scope, [0.0, 1.0]) is None
+    assert cache.get(cache.scope_key(["p2"], False), [1.0, 0.0]) is None
+    assert cache.get(cache.scope_key(["p1"], True), [1.0, 0.0]) is None
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    cache = make_cache()
+    scope = cache.scope_key(None, False)
+    cache.put_exact(scope, "What did I decide?", RESPONSE)
+
+    assert cache.get_exact(scope, "  what did   i decide? ") is RESPONSE
+    assert cache.get_exact(scope, "what did you decide?") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(recall_cache_module.time, "monotonic", lambda: now[0])
+    cache = make_cache(ttl_seconds=10)
+    scope = cache.scope_key(["p1"], False)
+    cache.put(scope, [1.0, 0.0], RESPONSE)
+    cache.put_exact(scope, "q", RESPONSE)
+
+    now[0] += 11
+
+    assert cache.get(scope, [1.0, 0.0]) is None
+    assert cache.get_exact(scope, "q") is None
+
+
+def test_exact_level_is_lru_bounded():
+    cache = make_cache(max_entries=2)
+    scope = cache.scope_key(None, False)
+    cache.put_exact(scope, "a", {"n": 1})
+    cache.put_exact(scope, "b", {"n": 2})
+    cache.get_exact(scope, "a")
+    cache.put_exact(scope, "c", {"n": 3})
+
+    assert cache.get_exact(scope, "a") == {"n": 1}
+    assert cache.get_exact(scope, "b") is None
+    assert cache.get_exact(scope, "c") == {"n": 3}
+
+
+def test_invalidate_project_drops_its_scopes_and_global_scopes():
+    cache = make_cache()
+    p1 = cache.scope_key(["p1"], False)
+    p2 = cache.scope_key(["p2"], False)
+    both = cache.scope_key(["p2", "p1"], False)
+    global_scope = cache.scope_key(None, False)
+    for scope in (p1, p2, both, global_scope):
+        cache.put(scope, [1.0, 0.0], RESPONSE)
+        cache.put_exact(scope, "q", RESPONSE)
+
+    cache.invalidate_project("p1")
+
+    for scope in (p1, both, global_scope):
+        assert cache.get(scope, [1.0, 0.0]) is None
+        assert cache.get_exact(scope, "q") is None
+    assert cache.get(p2, [1.0, 0.0]) is RESPONSE
+    assert cache.get_exact(p2, "q") is RESPONSE
+
+
+def test_generation_changes_only_for_affected_scopes():
+    cache = make_cache()
+    p1 = cache.scope_key(["p1"], False)
+    p2 = cache.scope_key(["p2"], False)
+    global_scope = cache.scope_key(None, False)
+    before = {scope: cache.generation(scope) for scope in (p1, p2, global_scope)}
+
+    cache.invalidate_project("p1")
+
+    assert cache.generation(p1) != before[p1]
+    assert cache.generation(global_scope) != before[global_scope]
+    assert cache.generation(p2) == before[p2]
+
+
+def test_projects_version_change_flushes_everything():
+    cache = make_cache()
+    scope = cache.scope_key(["p1"], False)
+    cache.sync_projects_version(0)
+    cache.put(scope, [1.0, 0.0], RESPONSE)
+    cache.put_exact(scope, "q", RESPONSE)
+    generation = cache.generation(scope)
+
+    cache.sync_projects_version(0)
+    assert cache.get_exact(scope, "q") is RESPONSE
+
+    cache.sync_projects_version(1)
+    assert cache.get(scope, [1.0, 0.0]) is None
+    assert cache.get_exact(scope, "q") is None
+    assert cache.generation(scope) != generation
@@ -0,0 +1,70 @@
+"""Tests for the scoped vector store shared by the semantic caches."""
+
+import numpy as np
+
+from src.mcp.intelligence.vector_store import ScopedVectorStore
+
+
+def test_scores_are_cosine_similarities():
+    store = ScopedVectorStore(max_entries=4)
+    store.add("a", [3.0, 0.0], "x")
+    store.add("a", [1.0, 1.0], "y")
+
+    scores = store.scores("a", [2.0, 0.0])
+
+    np.testing.assert_allclose(scores, [1.0, np.sqrt(0.5)], rtol=1e-6)
+
+
+def test_limit_is_global_and_evicts_from_least_recently_used_scope():
+    store = ScopedVectorStore(max_entries=3)
+    store.add("a", [1.0, 0.0], 1)
+    store.add("a", [0.0, 1.0], 2)
+    store.add("b", [1.0, 1.0], 3)
+
+    # Touch "a" so "b" becomes the least recently used scope
+    store.scores("a", [1.0, 0.0])
+    store.add("c", [1.0, 0.0], 4)
+
+    assert store.entries("a") == [1, 2]
+    assert store.entries("b") is None
+    assert store.entries("c") == [4]
+
+
+def test_eviction_within_a_single_scope_drops_oldest_rows():
+    store = ScopedVectorStore(max_entries=2)
+    store.add("a", [1.0, 0.0], 1)
+    store.add("a", [0.0, 1.0], 2)
+    store.add("a", [1.0, 1.0], 3)
+
+    assert store.entries("a") == [2, 3]
+    assert store.scores("a", [0.0, 1.0]).shape == (2,)
+
+
+def test_drop_oldest_removes_empty_scope():
+    store = ScopedVectorStore(max_entries=4)
+    store.add("a", [1.0, 0.0], 1)
+
+    store.drop_oldest("a", 5)
+
+    assert store.entries("a") is None
+    # The freed capacity is available again
+    for i in range(4):
+        store.add("b", [1.0, float(i)], i)
+    assert store.entries("b") == [0, 1, 2, 3]
+
+
+def test_drop_scopes_and_clear_release_capacity():
+    store = ScopedVectorStore(max_entries=2)
+    store.add("p1", [1.0, 0.0], 1)
+    store.add("p2", [0.0, 1.0], 2)
+
+    assert store.drop_scopes(lambda scope: scope == "p1") == 1
+    store.add("p3", [1.0, 1.0], 3)
+    assert store.entries("p2") == [2]
+    assert store.entries("p3") == [3]
+
+    store.clear()
+    assert store.entries("p2") is None
+    store.add("p4", [1.0, 0.0], 4)
+    store.add("p4", [0.0, 1.0], 5)
+    assert store.entries("p4") == [4, 5]